@@ -1,56 +1,164 @@
 """Shared utilities for the Volur dashboard."""
 
+import atexit
+import io
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
-from typing import Dict, Any, Optional, List
+import threading
+from typing import Callable, Dict, Any, Optional, List, Set, Tuple
 import pandas as pd
-from datetime import datetime, timedelta
+import orjson
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, timedelta
+from functools import lru_cache, partial
+from heapq import nlargest
+from operator import itemgetter
 
 # Import Volur components
 from volur.plugins.sec_source import SECSource
-from volur.plugins.finnhub_source import FinnhubSource
 from volur.plugins.base import Quote, Fundamentals
 from volur.config import settings
 from volur.mongodb_cache import get_cache
 
 logger = logging.getLogger(__name__)
 
-
-def format_currency(value: Optional[float]) -> str:
-    """Format a value as currency."""
+# Shared HTTP session so repeat requests reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "Volur/0.1.0"})
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+))
+atexit.register(_SESSION.close)
+
+_ALPHA_VANTAGE_URL = "https://www.alphavantage.co/query"
+_FINNHUB_QUOTE_URL = "https://finnhub.io/api/v1/quote"
+_FINNHUB_PROFILE_URL = "https://finnhub.io/api/v1/stock/profile2"
+_FINNHUB_FINANCIALS_URL = "https://finnhub.io/api/v1/stock/financials-reported"
+_FINNHUB_METRIC_URL = "https://finnhub.io/api/v1/stock/metric"
+_FINNHUB_NEWS_URL = "https://finnhub.io/api/v1/company-news"
+# Sent per request rather than on the session so the token never reaches other hosts
+_FINNHUB_HEADERS = {"X-Finnhub-Token": settings.finnhub_api_key}
+
+# Shared worker pool for fanning out independent per-ticker fetches that a render is waiting on
+_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="volur-fetch")
+# Background cache warming gets its own small pool so it never queues ahead of renders on _POOL
+_PREFETCH_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="volur-prefetch")
+
+
+# The same prices and volumes are formatted across tabs and reruns; memoize the plain numbers
+_FORMAT_CACHE_SIZE = 4096
+# Exact types routed through the cache; bools, None and anything unhashable are formatted directly
+_CACHED_NUMBER_TYPES = (int, float)
+
+
+@lru_cache(maxsize=_FORMAT_CACHE_SIZE, typed=True)
+def _format_cached(formatter: Callable[[Any], str], value: float) -> str:
+    """Memoize one formatter's output for an int or float value."""
+    return formatter(value)
+
+
+def _currency(value: Optional[float]) -> str:
+    """Uncached body of format_currency."""
     if value is None:
         return "N/A"
     return f"${value:,.2f}"
 
 
-def format_percentage(value: Optional[float]) -> str:
-    """Format a value as percentage."""
+def _percentage(value: Optional[float]) -> str:
+    """Uncached body of format_percentage."""
     if value is None:
         return "N/A"
     return f"{value:.2f}%"
 
 
-def format_number(value: Optional[float]) -> str:
-    """Format a large number with appropriate suffixes."""
+def _ratio(value: Optional[float]) -> str:
+    """Uncached body of format_ratio."""
+    if not value:
+        return "N/A"
+    return f"{value:.2f}"
+
+
+# Suffix thresholds for format_number, largest first
+_NUMBER_UNITS = ((1e12, "T"), (1e9, "B"), (1e6, "M"), (1e3, "K"))
+
+
+def _number(value: Optional[float]) -> str:
+    """Uncached body of format_number."""
     if value is None:
         return "N/A"
     
-    if value >= 1e12:
-        return f"{value/1e12:.2f}T"
-    elif value >= 1e9:
-        return f"{value/1e9:.2f}B"
-    elif value >= 1e6:
-        return f"{value/1e6:.2f}M"
-    elif value >= 1e3:
-        return f"{value/1e3:.2f}K"
-    else:
-        return f"{value:.2f}"
+    for threshold, suffix in _NUMBER_UNITS:
+        if value >= threshold:
+            return f"{value/threshold:.2f}{suffix}"
+    return f"{value:.2f}"
+
+
+def _format(formatter: Callable[[Any], str], value: Any) -> str:
+    """Format through the cache when value is a plain int or float."""
+    if type(value) in _CACHED_NUMBER_TYPES:
+        return _format_cached(formatter, value)
+    return formatter(value)
+
+
+def format_currency(value: Optional[float]) -> str:
+    """Format a value as currency."""
+    return _format(_currency, value)
+
+
+def format_percentage(value: Optional[float]) -> str:
+    """Format a value as percentage."""
+    return _format(_percentage, value)
+
+
+def format_ratio(value: Optional[float]) -> str:
+    """Format a ratio to two decimals."""
+    return _format(_ratio, value)
+
+
+def format_number(value: Optional[float]) -> str:
+    """Format a large number with appropriate suffixes."""
+    return _format(_number, value)
+
+
+def _parse_percent(value: Any) -> float:
+    """Parse an Alpha Vantage percent string such as '1.2345%'."""
+    return float(str(value).rstrip("%") or 0)
+
+
+def _parse_av_fields(quote_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert the numeric Global Quote fields, defaulting any missing or malformed one to 0."""
+    result = {}
+    for name, key, cast in _AV_FIELDS:
+        try:
+            result[name] = cast(quote_data.get(key) or 0)
+        except (TypeError, ValueError):
+            logger.warning("Unparseable Alpha Vantage field %r: %r", key, quote_data.get(key))
+            result[name] = cast(0)
+    return result
+
 
+# (result key, Global Quote key, caster) for the numeric Alpha Vantage fields
+_AV_FIELDS = (
+    ("regularMarketPrice", "05. price", float),
+    ("regularMarketPreviousClose", "08. previous close", float),
+    ("regularMarketDayHigh", "03. high", float),
+    ("regularMarketDayLow", "04. low", float),
+    ("regularMarketVolume", "06. volume", int),
+    ("open", "02. open", float),
+    ("change", "09. change", float),
+    ("change_percent", "10. change percent", _parse_percent),
+)
 
+
+@st.cache_data(ttl=30, show_spinner=False)
 def get_alpha_vantage_data(ticker: str) -> Dict[str, Any]:
     """Get market data from Alpha Vantage API."""
-    logger.info(f"Fetching Alpha Vantage data for ticker: {ticker}")
+    logger.info("Fetching Alpha Vantage data for ticker: %s", ticker)
     
     try:
         api_key = settings.alpha_vantage_api_key
@@ -58,287 +166,317 @@ def get_alpha_vantage_data(ticker: str) -> Dict[str, Any]:
             logger.error("Alpha Vantage API key not configured")
             return {}
         
-        logger.info(f"Using Alpha Vantage API key: {api_key[:8]}...")
+        logger.info("Using Alpha Vantage API key: %s...", api_key[:8])
         
-        url = f"https://www.alphavantage.co/query"
         params = {
             "function": "GLOBAL_QUOTE",
             "symbol": ticker,
             "apikey": api_key
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = _SESSION.get(_ALPHA_VANTAGE_URL, params=params, timeout=10)
         response.raise_for_status()
         
-        data = response.json()
-        logger.info(f"Alpha Vantage response keys: {list(data.keys())}")
+        data = orjson.loads(response.content)
+        logger.info("Alpha Vantage response keys: %s", list(data.keys()))
         
         if "Global Quote" in data:
             quote_data = data["Global Quote"]
             logger.info("Alpha Vantage data retrieved successfully")
             
-            return {
-                "regularMarketPrice": float(quote_data.get("05. price", 0)),
-                "regularMarketPreviousClose": float(quote_data.get("08. previous close", 0)),
-                "regularMarketDayHigh": float(quote_data.get("03. high", 0)),
-                "regularMarketDayLow": float(quote_data.get("04. low", 0)),
-                "regularMarketVolume": int(quote_data.get("06. volume", 0)),
-                "open": float(quote_data.get("02. open", 0)),
-                "change": float(quote_data.get("09. change", 0)),
-                "change_percent": float(quote_data.get("10. change percent", 0).replace("%", "")),
-                "timestamp": quote_data.get("07. latest trading day", ""),
-                "marketCap": None,  # Not available in Global Quote
-                "longName": ticker,
-                "sector": "Unknown",
-                "industry": "Unknown",
-                "exchange": "Unknown",
-                "trailingPE": None,
-                "forwardPE": None,
-                "priceToBook": None,
-                "beta": None,
-                "dividendYield": None,
-                "fiftyTwoWeekHigh": None,
-                "fiftyTwoWeekLow": None
-            }
+            # Global Quote carries no profile or valuation fields; consumers use .get()
+            result = _parse_av_fields(quote_data)
+            result["timestamp"] = quote_data.get("07. latest trading day", "")
+            return result
         else:
-            logger.warning(f"Unexpected Alpha Vantage response: {data}")
+            logger.warning("Unexpected Alpha Vantage response: %s", data)
             return {}
             
     except Exception as e:
-        logger.error(f"Alpha Vantage API error: {e}")
+        logger.error("Alpha Vantage API error: %s", e)
         return {}
 
 
+@st.cache_data(ttl=30, show_spinner=False)
 def get_finnhub_data(ticker: str) -> Dict[str, Any]:
     """Get market data from Finnhub API."""
-    logger.info(f"Fetching Finnhub data for ticker: {ticker}")
+    logger.info("Fetching Finnhub data for ticker: %s", ticker)
     
     try:
-        finnhub_source = FinnhubSource()
-        quote = finnhub_source.get_quote(ticker)
+        params = {"symbol": ticker}
         
-        if quote:
-            logger.info("[SUCCESS] Finnhub data retrieved successfully")
-            
-            # Get additional data from Finnhub API directly for dashboard display
+        # Quote and company profile are independent, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            quote_future = executor.submit(
+                _SESSION.get, _FINNHUB_QUOTE_URL,
+                params=params, headers=_FINNHUB_HEADERS, timeout=10
+            )
+            profile_future = executor.submit(
+                _SESSION.get, _FINNHUB_PROFILE_URL,
+                params=params, headers=_FINNHUB_HEADERS, timeout=10
+            )
+            quote_response = quote_future.result()
             try:
-                # Get quote data for additional fields
-                quote_url = f"https://finnhub.io/api/v1/quote"
-                params = {"symbol": ticker}
-                headers = {
-                    "X-Finnhub-Token": settings.finnhub_api_key,
-                    "User-Agent": "Volur/0.1.0"
-                }
-                
-                response = requests.get(quote_url, params=params, headers=headers, timeout=10)
-                quote_data = response.json() if response.status_code == 200 else {}
-                
-                # Get company profile for additional fields
-                profile_url = f"https://finnhub.io/api/v1/stock/profile2"
-                profile_params = {"symbol": ticker}
-                
-                profile_response = requests.get(profile_url, params=profile_params, headers=headers, timeout=10)
-                profile_data = profile_response.json() if profile_response.status_code == 200 else {}
-                
-                return {
-                    # Basic quote data
-                    "regularMarketPrice": quote.price,
-                    "regularMarketPreviousClose": quote_data.get('pc', 0.0),
-                    "regularMarketDayHigh": quote_data.get('h', 0.0),
-                    "regularMarketDayLow": quote_data.get('l', 0.0),
-                    "regularMarketVolume": quote_data.get('v', 0),
-                    "open": quote_data.get('o', 0.0),
-                    "change": quote_data.get('d', 0.0),
-                    "change_percent": quote_data.get('dp', 0.0),
-                    "timestamp": quote_data.get('t', 0),
-                    
-                    # Company profile data
-                    "marketCap": profile_data.get('marketCapitalization', 0.0),
-                    "longName": profile_data.get('name', ticker),
-                    "ticker": profile_data.get('ticker', ticker),
-                    "sector": profile_data.get('finnhubIndustry', 'Unknown'),
-                    "industry": profile_data.get('finnhubIndustry', 'Unknown'),
-                    "exchange": profile_data.get('exchange', 'Unknown'),
-                    "country": profile_data.get('country', 'Unknown'),
-                    "currency": profile_data.get('currency', 'USD'),
-                    "sharesOutstanding": profile_data.get('shareOutstanding'),
-                    "ipo": profile_data.get('ipo', 'N/A'),
-                    "phone": profile_data.get('phone', 'N/A'),
-                    "weburl": profile_data.get('weburl', ''),
-                    "logo": profile_data.get('logo', ''),
-                    
-                    # Additional fields (not available from basic quote)
-                    "trailingPE": None,
-                    "forwardPE": None,
-                    "priceToBook": None,
-                    "beta": None,
-                    "dividendYield": None,
-                    "fiftyTwoWeekHigh": None,
-                    "fiftyTwoWeekLow": None
-                }
+                profile_response = profile_future.result()
             except Exception as e:
-                logger.error(f"Error getting additional Finnhub data: {e}")
-                # Return basic data from Quote object
-                return {
-                    "regularMarketPrice": quote.price,
-                    "regularMarketPreviousClose": None,
-                    "regularMarketDayHigh": None,
-                    "regularMarketDayLow": None,
-                    "regularMarketVolume": None,
-                    "marketCap": None,
-                    "longName": ticker,
-                    "sector": "Unknown",
-                    "industry": "Unknown",
-                    "exchange": "Unknown",
-                    "trailingPE": None,
-                    "forwardPE": None,
-                    "priceToBook": None,
-                    "beta": None,
-                    "dividendYield": None,
-                    "fiftyTwoWeekHigh": None,
-                    "fiftyTwoWeekLow": None
-                }
-        else:
+                logger.error("Error getting Finnhub profile data: %s", e)
+                profile_response = None
+        
+        quote_data = orjson.loads(quote_response.content) if quote_response.status_code == 200 else {}
+        profile_data = orjson.loads(profile_response.content) if profile_response is not None and profile_response.status_code == 200 else {}
+        
+        # Finnhub reports a current price of 0 for unknown symbols
+        if not quote_data.get('c'):
             logger.warning("Finnhub returned empty quote data")
             return {}
+        
+        logger.info("[SUCCESS] Finnhub data retrieved successfully")
+        
+        return {
+            # Basic quote data
+            "regularMarketPrice": quote_data.get('c', 0.0),
+            "regularMarketPreviousClose": quote_data.get('pc', 0.0),
+            "regularMarketDayHigh": quote_data.get('h', 0.0),
+            "regularMarketDayLow": quote_data.get('l', 0.0),
+            "regularMarketVolume": quote_data.get('v', 0),
+            "open": quote_data.get('o', 0.0),
+            "change": quote_data.get('d', 0.0),
+            "change_percent": quote_data.get('dp', 0.0),
+            "timestamp": quote_data.get('t', 0),
+            
+            # Company profile data
+            "marketCap": profile_data.get('marketCapitalization', 0.0),
+            "longName": profile_data.get('name', ticker),
+            "ticker": profile_data.get('ticker', ticker),
+            "sector": profile_data.get('finnhubIndustry', 'Unknown'),
+            "industry": profile_data.get('finnhubIndustry', 'Unknown'),
+            "exchange": profile_data.get('exchange', 'Unknown'),
+            "country": profile_data.get('country', 'Unknown'),
+            "currency": profile_data.get('currency', 'USD'),
+            "sharesOutstanding": profile_data.get('shareOutstanding'),
+            "ipo": profile_data.get('ipo', 'N/A'),
+            "phone": profile_data.get('phone', 'N/A'),
+            "weburl": profile_data.get('weburl', ''),
+            "logo": profile_data.get('logo', '')
+        }
             
     except Exception as e:
-        logger.error(f"Finnhub API error: {e}")
+        logger.error("Finnhub API error: %s", e)
         return {}
 
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def get_finnhub_financials(ticker: str) -> Dict[str, Any]:
     """Get financial statements from Finnhub API."""
-    logger.info(f"Fetching Finnhub financials for ticker: {ticker}")
+    logger.info("Fetching Finnhub financials for ticker: %s", ticker)
     
     try:
         # Get financial statements from Finnhub API
-        financials_url = f"https://finnhub.io/api/v1/stock/financials-reported"
         params = {
             "symbol": ticker,
             "freq": "annual"  # annual or quarterly
         }
-        headers = {
-            "X-Finnhub-Token": settings.finnhub_api_key,
-            "User-Agent": "Volur/0.1.0"
-        }
         
-        logger.info(f"Fetching financials for {ticker} (annual frequency)")
-        response = requests.get(financials_url, params=params, headers=headers, timeout=15)
+        logger.info("Fetching financials for %s (annual frequency)", ticker)
+        response = _SESSION.get(_FINNHUB_FINANCIALS_URL, params=params, headers=_FINNHUB_HEADERS, timeout=15)
         response.raise_for_status()
         
-        financials_data = response.json()
-        logger.info(f"Retrieved financials data for {ticker}")
+        financials_data = orjson.loads(response.content)
+        logger.info("Retrieved financials data for %s", ticker)
         
         return financials_data
         
     except Exception as e:
-        logger.error(f"Finnhub financials API error: {e}")
+        logger.error("Finnhub financials API error: %s", e)
         return {}
 
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def get_finnhub_basic_financials(ticker: str) -> Dict[str, Any]:
     """Get basic financial metrics from Finnhub API."""
-    logger.info(f"Fetching Finnhub basic financials for ticker: {ticker}")
+    logger.info("Fetching Finnhub basic financials for ticker: %s", ticker)
     
     try:
         # Get basic financial metrics from Finnhub API
-        basic_financials_url = f"https://finnhub.io/api/v1/stock/metric"
         params = {
             "symbol": ticker,
             "metric": "all"  # Get all available metrics
         }
-        headers = {
-            "X-Finnhub-Token": settings.finnhub_api_key,
-            "User-Agent": "Volur/0.1.0"
-        }
         
-        logger.info(f"Fetching basic financials for {ticker}")
-        response = requests.get(basic_financials_url, params=params, headers=headers, timeout=15)
+        logger.info("Fetching basic financials for %s", ticker)
+        response = _SESSION.get(_FINNHUB_METRIC_URL, params=params, headers=_FINNHUB_HEADERS, timeout=15)
         response.raise_for_status()
         
-        basic_financials_data = response.json()
-        logger.info(f"Retrieved basic financials data for {ticker}")
+        basic_financials_data = orjson.loads(response.content)
+        logger.info("Retrieved basic financials data for %s", ticker)
         
         return basic_financials_data
         
     except Exception as e:
-        logger.error(f"Finnhub basic financials API error: {e}")
+        logger.error("Finnhub basic financials API error: %s", e)
         return {}
 
 
+@lru_cache(maxsize=2)
+def _news_date_window(today_ordinal: int) -> Tuple[str, str]:
+    """Return the (from, to) ISO dates covering the last 7 days, computed once per day."""
+    today = date.fromordinal(today_ordinal)
+    return (today - timedelta(days=7)).isoformat(), today.isoformat()
+
+
+@st.cache_data(ttl=300, show_spinner=False)
 def get_finnhub_news(ticker: str) -> List[Dict[str, Any]]:
     """Get company news from Finnhub API."""
-    logger.info(f"Fetching Finnhub news for ticker: {ticker}")
+    logger.info("Fetching Finnhub news for ticker: %s", ticker)
     
     try:
         # Get company news from Finnhub API
-        news_url = f"https://finnhub.io/api/v1/company-news"
+        date_from, date_to = _news_date_window(date.today().toordinal())
         params = {
             "symbol": ticker,
-            "from": (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d'),  # Last 7 days
-            "to": datetime.now().strftime('%Y-%m-%d')
-        }
-        headers = {
-            "X-Finnhub-Token": settings.finnhub_api_key,
-            "User-Agent": "Volur/0.1.0"
+            "from": date_from,
+            "to": date_to
         }
         
-        logger.info(f"Fetching news from: {params['from']} to {params['to']}")
-        response = requests.get(news_url, params=params, headers=headers, timeout=15)
+        logger.info("Fetching news from: %s to %s", params['from'], params['to'])
+        response = _SESSION.get(_FINNHUB_NEWS_URL, params=params, headers=_FINNHUB_HEADERS, timeout=15)
         response.raise_for_status()
         
-        news_data = response.json()
-        logger.info(f"Retrieved {len(news_data)} news articles for {ticker}")
-        
-        # Sort by datetime (most recent first)
-        news_data.sort(key=lambda x: x.get('datetime', 0), reverse=True)
+        news_data = orjson.loads(response.content)
+        logger.info("Retrieved %s news articles for %s", len(news_data), ticker)
         
-        return news_data[:20]  # Return top 20 most recent articles
+        # Keep the 20 most recent articles without sorting the whole feed
+        return nlargest(20, (n for n in news_data if 'datetime' in n), key=itemgetter('datetime'))
         
     except Exception as e:
-        logger.error(f"Finnhub news API error: {e}")
+        logger.error("Finnhub news API error: %s", e)
         return []
 
 
+# One SEC source for the process, so its HTTP session is reused across tickers
+_SEC_SOURCE = SECSource()
+# Fundamentals fields carried in the cached SEC dict, besides the ticker
+_SEC_FIELDS = (
+    "trailing_pe", "price_to_book", "roe", "roa", "debt_to_equity", "free_cash_flow",
+    "revenue", "operating_margin", "sector", "name",
+)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_sec_data(ticker: str) -> Dict[str, Any]:
+    """Get fundamentals from SEC EDGAR as a plain dict."""
+    logger.info("Fetching SEC EDGAR data for ticker: %s", ticker)
+    
+    try:
+        fundamentals = _SEC_SOURCE.get_fundamentals(ticker)
+        
+        # Convert to dict for caching
+        return {"ticker": fundamentals.ticker, **{field: getattr(fundamentals, field) for field in _SEC_FIELDS}}
+        
+    except Exception as e:
+        logger.error("Error fetching SEC data: %s", e)
+        return {}
+
+
+def sec_data_to_fundamentals(sec_data: Dict[str, Any], ticker: str) -> Optional[Fundamentals]:
+    """Rebuild a Fundamentals object from cached SEC data, or None when there is none."""
+    if not sec_data:
+        return None
+    return Fundamentals(ticker=sec_data.get("ticker", ticker), **{field: sec_data.get(field) for field in _SEC_FIELDS})
+
+
+# Above this many serialized bytes, raw payloads render as plain highlighted text
+_RAW_JSON_TREE_LIMIT = 50_000
+# Above this many, only a preview is shown and the full payload is offered as a download
+_RAW_JSON_PREVIEW_LIMIT = 500_000
+
+
+@st.fragment
+def display_raw_json(data: Any, file_name: str = "data.json"):
+    """Display a raw API payload, falling back from the interactive JSON tree for large payloads.
+
+    Nothing is serialized until the user switches the view on, and switching it reruns only this
+    fragment rather than the whole page. file_name also keys the toggle, so it must be unique per page.
+    """
+    if not st.toggle("Show raw JSON", key=f"show_raw_{file_name}"):
+        return
+    raw = orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    if len(raw) <= _RAW_JSON_TREE_LIMIT:
+        st.json(data)
+    elif len(raw) <= _RAW_JSON_PREVIEW_LIMIT:
+        st.code(raw.decode(), language="json")
+    else:
+        st.caption(f"Showing the first {_RAW_JSON_PREVIEW_LIMIT:,} of {len(raw):,} bytes")
+        st.code(raw[:_RAW_JSON_PREVIEW_LIMIT].decode(errors="ignore"), language="json")
+        st.download_button(
+            label="📥 Download Full Data (JSON)",
+            data=raw,
+            file_name=file_name,
+            mime="application/json"
+        )
+
+
+def _text_or_na(value: Optional[str]) -> str:
+    """Show a plain text value, or N/A when missing."""
+    return value or "N/A"
+
+
+# (label, formatter, attribute) rows for the quote and fundamentals panels
+_QUOTE_METRICS = (
+    ("Price", format_currency, "price"),
+    ("Currency", _text_or_na, "currency"),
+    ("Shares Outstanding", format_number, "shares_outstanding"),
+    ("Ticker", _text_or_na, "ticker"),
+)
+
+_FUNDAMENTALS_METRICS = (
+    ("Revenue", format_currency, "revenue"),
+    ("Free Cash Flow", format_currency, "free_cash_flow"),
+    ("Operating Margin", format_percentage, "operating_margin"),
+    ("Trailing PE", format_ratio, "trailing_pe"),
+    ("ROE", format_percentage, "roe"),
+    ("ROA", format_percentage, "roa"),
+    ("Debt-to-Equity", format_ratio, "debt_to_equity"),
+    ("Price-to-Book", format_ratio, "price_to_book"),
+)
+
+
+def _render_metrics(obj: Any, metrics: tuple, columns: int = 4):
+    """Render metrics row by row across a single set of columns."""
+    cols = st.columns(columns)
+    for i, (label, fmt, attr) in enumerate(metrics):
+        cols[i % columns].metric(label, fmt(getattr(obj, attr)))
+
+
 def display_quote_data(quote: Quote, source_name: str):
     """Display quote data in a formatted way."""
     st.subheader(f"📈 Quote Data ({source_name})")
-    
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.metric("Price", format_currency(quote.price))
-    with col2:
-        st.metric("Currency", quote.currency or "N/A")
-    with col3:
-        st.metric("Shares Outstanding", format_number(quote.shares_outstanding))
-    with col4:
-        st.metric("Ticker", quote.ticker)
+    _render_metrics(quote, _QUOTE_METRICS)
 
 
 def display_fundamentals_data(fundamentals: Fundamentals, source_name: str):
     """Display fundamentals data in a formatted way."""
     st.subheader(f"📊 Fundamentals Data ({source_name})")
-    
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.metric("Revenue", format_currency(fundamentals.revenue))
-    with col2:
-        st.metric("Free Cash Flow", format_currency(fundamentals.free_cash_flow))
-    with col3:
-        st.metric("Operating Margin", format_percentage(fundamentals.operating_margin))
-    with col4:
-        st.metric("Trailing PE", f"{fundamentals.trailing_pe:.2f}" if fundamentals.trailing_pe else "N/A")
-    
-    col5, col6, col7, col8 = st.columns(4)
-    with col5:
-        st.metric("ROE", format_percentage(fundamentals.roe))
-    with col6:
-        st.metric("ROA", format_percentage(fundamentals.roa))
-    with col7:
-        st.metric("Debt-to-Equity", f"{fundamentals.debt_to_equity:.2f}" if fundamentals.debt_to_equity else "N/A")
-    with col8:
-        st.metric("Price-to-Book", f"{fundamentals.price_to_book:.2f}" if fundamentals.price_to_book else "N/A")
+    _render_metrics(fundamentals, _FUNDAMENTALS_METRICS)
+
+
+def _fetch_fresh(fetch: Callable[[str], Any], ticker: str, force_refresh: bool = False) -> Any:
+    """Call a memoized fetcher, bypassing it on refresh and never keeping failed results."""
+    if force_refresh:
+        fetch.clear(ticker)
+    data = fetch(ticker)
+    if not data:
+        fetch.clear(ticker)
+    return data
+
+
+def fetch_concurrently(ticker: str, *fetchers: Callable[..., Any], force_refresh: bool = False) -> List[Any]:
+    """Run several get_cached_* fetchers for one ticker in parallel, returning results in order.
+
+    A cold-cache load then takes as long as the slowest source rather than the sum of all of them.
+    """
+    futures = [_POOL.submit(fetch, ticker, force_refresh) for fetch in fetchers]
+    return [future.result() for future in futures]
 
 
 # MongoDB Cached API Functions
@@ -350,12 +488,12 @@ def get_cached_alpha_vantage_data(ticker: str, force_refresh: bool = False) -> D
     if not force_refresh:
         cached_data = cache.get("alpha_vantage", ticker, "quote_data")
         if cached_data:
-            logger.info(f"Retrieved Alpha Vantage data from cache for {ticker}")
+            logger.info("Retrieved Alpha Vantage data from cache for %s", ticker)
             return cached_data["data"]
     
     # Fetch fresh data
-    logger.info(f"Fetching fresh Alpha Vantage data for {ticker}")
-    data = get_alpha_vantage_data(ticker)
+    logger.info("Fetching fresh Alpha Vantage data for %s", ticker)
+    data = _fetch_fresh(get_alpha_vantage_data, ticker, force_refresh)
     
     # Cache the data
     if data:
@@ -372,12 +510,12 @@ def get_cached_finnhub_data(ticker: str, force_refresh: bool = False) -> Dict[st
     if not force_refresh:
         cached_data = cache.get("finnhub", ticker, "quote_data")
         if cached_data:
-            logger.info(f"Retrieved Finnhub data from cache for {ticker}")
+            logger.info("Retrieved Finnhub data from cache for %s", ticker)
             return cached_data["data"]
     
     # Fetch fresh data
-    logger.info(f"Fetching fresh Finnhub data for {ticker}")
-    data = get_finnhub_data(ticker)
+    logger.info("Fetching fresh Finnhub data for %s", ticker)
+    data = _fetch_fresh(get_finnhub_data, ticker, force_refresh)
     
     # Cache the data
     if data:
@@ -394,12 +532,12 @@ def get_cached_finnhub_news(ticker: str, force_refresh: bool = False) -> List[Di
     if not force_refresh:
         cached_data = cache.get("finnhub", ticker, "news")
         if cached_data:
-            logger.info(f"Retrieved Finnhub news from cache for {ticker}")
+            logger.info("Retrieved Finnhub news from cache for %s", ticker)
             return cached_data["data"]
     
     # Fetch fresh data
-    logger.info(f"Fetching fresh Finnhub news for {ticker}")
-    data = get_finnhub_news(ticker)
+    logger.info("Fetching fresh Finnhub news for %s", ticker)
+    data = _fetch_fresh(get_finnhub_news, ticker, force_refresh)
     
     # Cache the data
     if data:
@@ -416,12 +554,12 @@ def get_cached_finnhub_financials(ticker: str, force_refresh: bool = False) -> D
     if not force_refresh:
         cached_data = cache.get("finnhub", ticker, "financials")
         if cached_data:
-            logger.info(f"Retrieved Finnhub financials from cache for {ticker}")
+            logger.info("Retrieved Finnhub financials from cache for %s", ticker)
             return cached_data["data"]
     
     # Fetch fresh data
-    logger.info(f"Fetching fresh Finnhub financials for {ticker}")
-    data = get_finnhub_financials(ticker)
+    logger.info("Fetching fresh Finnhub financials for %s", ticker)
+    data = _fetch_fresh(get_finnhub_financials, ticker, force_refresh)
     
     # Cache the data
     if data:
@@ -438,12 +576,12 @@ def get_cached_finnhub_basic_financials(ticker: str, force_refresh: bool = False
     if not force_refresh:
         cached_data = cache.get("finnhub", ticker, "basic_financials")
         if cached_data:
-            logger.info(f"Retrieved Finnhub basic financials from cache for {ticker}")
+            logger.info("Retrieved Finnhub basic financials from cache for %s", ticker)
             return cached_data["data"]
     
     # Fetch fresh data
-    logger.info(f"Fetching fresh Finnhub basic financials for {ticker}")
-    data = get_finnhub_basic_financials(ticker)
+    logger.info("Fetching fresh Finnhub basic financials for %s", ticker)
+    data = _fetch_fresh(get_finnhub_basic_financials, ticker, force_refresh)
     
     # Cache the data
     if data:
@@ -452,6 +590,41 @@ def get_cached_finnhub_basic_financials(ticker: str, force_refresh: bool = False
     return data
 
 
+# (cache endpoint, raw fetcher, ttl_hours) for every Finnhub dataset shown per ticker
+_FINNHUB_ENDPOINTS = (
+    ("quote_data", get_finnhub_data, 24),
+    ("news", get_finnhub_news, 6),
+    ("financials", get_finnhub_financials, 48),
+    ("basic_financials", get_finnhub_basic_financials, 48),
+)
+
+
+def get_cached_finnhub_bundle(ticker: str) -> Dict[str, Any]:
+    """Get every Finnhub dataset for a ticker with one cache read and one cache write.
+
+    Misses are fetched from the API in parallel. Returns a dict keyed by cache endpoint.
+    """
+    cache = get_cache()
+    cached = cache.get_many([("finnhub", ticker, endpoint) for endpoint, _, _ in _FINNHUB_ENDPOINTS])
+    bundle = {endpoint: entry["data"] for (_, _, endpoint), entry in cached.items()}
+    
+    misses = [spec for spec in _FINNHUB_ENDPOINTS if spec[0] not in bundle]
+    if misses:
+        logger.info("Fetching %s Finnhub datasets for %s", len(misses), ticker)
+        # A private executor: this can itself run on a pool thread, where waiting on that pool could starve
+        with ThreadPoolExecutor(max_workers=len(misses)) as executor:
+            futures = [(endpoint, ttl, executor.submit(_fetch_fresh, fetch, ticker)) for endpoint, fetch, ttl in misses]
+            fresh = []
+            for endpoint, ttl, future in futures:
+                data = future.result()
+                bundle[endpoint] = data
+                if data:
+                    fresh.append(("finnhub", ticker, endpoint, data, ttl))
+        cache.set_many(fresh)
+    
+    return bundle
+
+
 def get_cached_sec_data(ticker: str, force_refresh: bool = False) -> Dict[str, Any]:
     """Get SEC data with MongoDB caching."""
     cache = get_cache()
@@ -460,39 +633,49 @@ def get_cached_sec_data(ticker: str, force_refresh: bool = False) -> Dict[str, A
     if not force_refresh:
         cached_data = cache.get("sec", ticker, "fundamentals")
         if cached_data:
-            logger.info(f"Retrieved SEC data from cache for {ticker}")
+            logger.info("Retrieved SEC data from cache for %s", ticker)
             return cached_data["data"]
     
     # Fetch fresh data
-    logger.info(f"Fetching fresh SEC data for {ticker}")
-    try:
-        sec_source = SECSource()
-        fundamentals = sec_source.get_fundamentals(ticker)
-        
-        # Convert to dict for caching
-        data = {
-            "ticker": fundamentals.ticker,
-            "trailing_pe": fundamentals.trailing_pe,
-            "price_to_book": fundamentals.price_to_book,
-            "roe": fundamentals.roe,
-            "roa": fundamentals.roa,
-            "debt_to_equity": fundamentals.debt_to_equity,
-            "free_cash_flow": fundamentals.free_cash_flow,
-            "revenue": fundamentals.revenue,
-            "operating_margin": fundamentals.operating_margin,
-            "sector": fundamentals.sector,
-            "name": fundamentals.name
-        }
-        
-        # Cache the data
-        if data:
-            cache.set("sec", ticker, "fundamentals", data, ttl_hours=72)  # SEC data can be cached longer
-        
-        return data
-        
-    except Exception as e:
-        logger.error(f"Error fetching SEC data: {e}")
-        return {}
+    logger.info("Fetching fresh SEC data for %s", ticker)
+    data = _fetch_fresh(get_sec_data, ticker, force_refresh)
+    
+    # Cache the data
+    if data:
+        cache.set("sec", ticker, "fundamentals", data, ttl_hours=72)  # SEC data can be cached longer
+    
+    return data
+
+
+# Per-ticker datasets warmed in the background when the ticker changes
+_PREFETCHERS = (get_cached_finnhub_bundle, get_cached_sec_data)
+# (fetcher, ticker) prefetches still running, so concurrent sessions don't queue duplicates
+_PREFETCHING: Set[Tuple[Callable[[str], Any], str]] = set()
+_PREFETCH_LOCK = threading.Lock()
+
+
+def _finish_prefetch(key: Tuple[Callable[[str], Any], str], future: Future) -> None:
+    """Release a finished prefetch and surface its failure, since nobody waits on it."""
+    with _PREFETCH_LOCK:
+        _PREFETCHING.discard(key)
+    error = future.exception()
+    if error is not None:
+        logger.warning("Background prefetch failed: %s", error)
+
+
+def prefetch_ticker(ticker: str) -> None:
+    """Start warming the Finnhub and SEC caches for a ticker without waiting for them.
+
+    Only the open tab renders on a rerun, so this lets the other tabs load from cache when opened.
+    Alpha Vantage is left to its tabs because of its tight daily request quota.
+    """
+    for fetch in _PREFETCHERS:
+        key = (fetch, ticker)
+        with _PREFETCH_LOCK:
+            if key in _PREFETCHING:
+                continue
+            _PREFETCHING.add(key)
+        _PREFETCH_POOL.submit(fetch, ticker).add_done_callback(partial(_finish_prefetch, key))
 
 
 def get_cache_info(source: str, ticker: str, endpoint: str) -> Optional[Dict[str, Any]]:
@@ -501,20 +684,36 @@ def get_cache_info(source: str, ticker: str, endpoint: str) -> Optional[Dict[str
     return cache.get(source, ticker, endpoint)
 
 
+# Memoized raw fetchers behind each cache source, cleared along with the source
+_SOURCE_FETCHERS = {
+    "alpha_vantage": (get_alpha_vantage_data,),
+    "finnhub": (get_finnhub_data, get_finnhub_financials, get_finnhub_basic_financials, get_finnhub_news),
+    "sec": (get_sec_data,),
+}
+
+
 def clear_cache_for_source(source: str) -> int:
     """Clear all cache entries for a specific source."""
     cache = get_cache()
+    for fetch in _SOURCE_FETCHERS.get(source, ()):
+        fetch.clear()
+    get_cache_stats.clear()
     return cache.clear_source(source)
 
 
 def clear_cache_for_ticker(ticker: str) -> int:
     """Clear all cache entries for a specific ticker."""
     cache = get_cache()
+    for fetchers in _SOURCE_FETCHERS.values():
+        for fetch in fetchers:
+            fetch.clear(ticker)
+    get_cache_stats.clear()
     return cache.clear_ticker(ticker)
 
 
+@st.cache_data(ttl=60, show_spinner=False)
 def get_cache_stats() -> Dict[str, Any]:
-    """Get overall cache statistics."""
+    """Get overall cache statistics (memoized briefly; the aggregation scans the whole collection)."""
     cache = get_cache()
     return cache.get_cache_stats()
 
@@ -529,7 +728,6 @@ def get_alpha_vantage_listing_status() -> Dict[str, Any]:
             return {}
         
         # Alpha Vantage LISTING_STATUS endpoint
-        url = "https://www.alphavantage.co/query"
         params = {
             "function": "LISTING_STATUS",
             "apikey": settings.alpha_vantage_api_key,
@@ -537,30 +735,27 @@ def get_alpha_vantage_listing_status() -> Dict[str, Any]:
         }
         
         logger.info("Fetching listing status from Alpha Vantage API")
-        response = requests.get(url, params=params, timeout=30)
+        response = _SESSION.get(_ALPHA_VANTAGE_URL, params=params, timeout=30)
         response.raise_for_status()
         
         # Parse CSV data
         csv_content = response.text
-        logger.info(f"Retrieved listing status data: {len(csv_content)} characters")
-        
-        # Parse CSV into list of dictionaries
-        import csv
-        import io
+        logger.info("Retrieved listing status data: %s characters", len(csv_content))
         
-        csv_reader = csv.DictReader(io.StringIO(csv_content))
-        securities_data = list(csv_reader)
+        # Parse CSV with pandas' C tokenizer; keep every field as the raw string, like csv.DictReader
+        securities_data = pd.read_csv(
+            io.StringIO(csv_content), dtype=str, keep_default_na=False
+        ).to_dict("records")
         
-        logger.info(f"Parsed {len(securities_data)} securities from listing status")
+        logger.info("Parsed %s securities from listing status", len(securities_data))
         
         return {
             "securities": securities_data,
-            "total_count": len(securities_data),
-            "raw_csv": csv_content
+            "total_count": len(securities_data)
         }
         
     except Exception as e:
-        logger.error(f"Alpha Vantage listing status API error: {e}")
+        logger.error("Alpha Vantage listing status API error: %s", e)
         return {}
 
 
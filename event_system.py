@@ -1,7 +1,10 @@
 """Event System for Volur Dashboard - Message-driven architecture."""
 
+import itertools
+import time
 import streamlit as st
-from typing import Dict, Any, List, Callable
+from collections import defaultdict, deque
+from typing import Dict, Any, List, Callable, DefaultDict, Deque
 from datetime import datetime
 import logging
 
@@ -9,43 +12,59 @@ logger = logging.getLogger(__name__)
 
 class Event:
     """Event class to represent messages."""
+    _counter = itertools.count()
+    
     def __init__(self, event_type: str, data: Dict[str, Any]):
         self.event_type = event_type
         self.data = data
-        self.timestamp = datetime.now()
-        self.event_id = f"{event_type}_{self.timestamp.strftime('%Y%m%d_%H%M%S_%f')}"
+        self.timestamp_ns = time.time_ns()
+        self.event_id = f"{event_type}_{next(Event._counter)}"
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Publish time as a local datetime, converted only when displayed."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
 
 class EventBus:
     """Event bus for managing event subscriptions and publishing."""
     
+    # Oldest events are dropped once this many have been recorded (overall and per type)
+    HISTORY_LIMIT = 1024
+    
     def __init__(self):
-        self.subscribers: Dict[str, List[Callable]] = {}
-        self.event_history: List[Event] = []
+        # Callbacks are dict keys: an ordered set, so re-subscribing on a rerun is a no-op
+        self.subscribers: DefaultDict[str, Dict[Callable, None]] = defaultdict(dict)
+        self.event_history: Deque[Event] = deque(maxlen=self.HISTORY_LIMIT)
+        self._history_by_type: DefaultDict[str, Deque[Event]] = defaultdict(
+            lambda: deque(maxlen=self.HISTORY_LIMIT)
+        )
     
     def subscribe(self, event_type: str, callback: Callable):
         """Subscribe to an event type."""
-        if event_type not in self.subscribers:
-            self.subscribers[event_type] = []
-        self.subscribers[event_type].append(callback)
+        self.subscribers[event_type][callback] = None
         logger.info(f"Subscribed to {event_type}")
     
+    def unsubscribe(self, event_type: str, callback: Callable):
+        """Unsubscribe a callback from an event type, if it is subscribed."""
+        self.subscribers[event_type].pop(callback, None)
+    
     def publish(self, event: Event):
         """Publish an event to all subscribers."""
         logger.info(f"Publishing event: {event.event_type}")
         self.event_history.append(event)
+        self._history_by_type[event.event_type].append(event)
         
-        if event.event_type in self.subscribers:
-            for callback in self.subscribers[event.event_type]:
-                try:
-                    callback(event)
-                except Exception as e:
-                    logger.error(f"Error in event callback: {e}")
+        for callback in list(self.subscribers.get(event.event_type, ())):
+            try:
+                callback(event)
+            except Exception as e:
+                logger.error(f"Error in event callback: {e}")
     
     def get_event_history(self, event_type: str = None) -> List[Event]:
         """Get event history, optionally filtered by event type."""
         if event_type:
-            return [e for e in self.event_history if e.event_type == event_type]
-        return self.event_history
+            return list(self._history_by_type.get(event_type, ()))
+        return list(self.event_history)
 
 # Global event bus instance
 event_bus = EventBus()
@@ -83,6 +102,10 @@ def subscribe_to_ticker_changes(callback: Callable):
     """Subscribe to ticker change events."""
     event_bus.subscribe(EventTypes.TICKER_CHANGED, callback)
 
+def unsubscribe_from_ticker_changes(callback: Callable):
+    """Unsubscribe from ticker change events."""
+    event_bus.unsubscribe(EventTypes.TICKER_CHANGED, callback)
+
 def subscribe_to_data_fetch_requests(callback: Callable):
     """Subscribe to data fetch request events."""
     event_bus.subscribe(EventTypes.DATA_FETCH_REQUESTED, callback)
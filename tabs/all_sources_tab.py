@@ -4,9 +4,36 @@ import streamlit as st
 import pandas as pd
 from typing import Dict, Any, Optional
 from dashboard_utils import (
-    format_currency, format_number, format_percentage,
+    format_currency, format_number, format_percentage, format_ratio,
     get_cached_alpha_vantage_data, get_cached_finnhub_data, get_cached_sec_data,
-    get_cache_info
+    get_cache_info, fetch_concurrently, sec_data_to_fundamentals
+)
+
+_COMPARISON_COLUMNS = ["Source", "Price", "Volume", "Change", "Market Cap", "PE Ratio"]
+
+# Info panel text for each source, shown side by side
+_SOURCE_ADVANTAGES = (
+    """
+    **Alpha Vantage**
+    - Real-time market data
+    - Global stock coverage
+    - Technical indicators
+    - Economic indicators
+    """,
+    """
+    **Finnhub**
+    - Real-time market data
+    - Company profiles & logos
+    - News & sentiment
+    - Financial statements
+    """,
+    """
+    **SEC EDGAR**
+    - Official filings
+    - Regulatory compliance
+    - Historical data
+    - Fundamental metrics
+    """,
 )
 
 
@@ -19,34 +46,20 @@ def render_all_sources_tab(ticker: str):
     with col2:
         if st.button("🔄 Refresh All Sources", key="refresh_all_sources"):
             # Force refresh all sources
-            market_data = get_cached_alpha_vantage_data(ticker, force_refresh=True)
-            finnhub_data = get_cached_finnhub_data(ticker, force_refresh=True)
-            sec_data = get_cached_sec_data(ticker, force_refresh=True)
+            fetch_concurrently(
+                ticker, get_cached_alpha_vantage_data, get_cached_finnhub_data, get_cached_sec_data,
+                force_refresh=True
+            )
             st.success("All sources refreshed!")
             st.rerun()
     
-    # Fetch data for this tab
-    market_data = get_cached_alpha_vantage_data(ticker)
-    finnhub_data = get_cached_finnhub_data(ticker)
-    sec_data = get_cached_sec_data(ticker)
+    # Fetch data for this tab; the three sources load in parallel
+    market_data, finnhub_data, sec_data = fetch_concurrently(
+        ticker, get_cached_alpha_vantage_data, get_cached_finnhub_data, get_cached_sec_data
+    )
     
     # Convert SEC data to Fundamentals object if available
-    sec_fundamentals = None
-    if sec_data:
-        from volur.plugins.base import Fundamentals
-        sec_fundamentals = Fundamentals(
-            ticker=sec_data.get("ticker", ticker),
-            trailing_pe=sec_data.get("trailing_pe"),
-            price_to_book=sec_data.get("price_to_book"),
-            roe=sec_data.get("roe"),
-            roa=sec_data.get("roa"),
-            debt_to_equity=sec_data.get("debt_to_equity"),
-            free_cash_flow=sec_data.get("free_cash_flow"),
-            revenue=sec_data.get("revenue"),
-            operating_margin=sec_data.get("operating_margin"),
-            sector=sec_data.get("sector"),
-            name=sec_data.get("name")
-        )
+    sec_fundamentals = sec_data_to_fundamentals(sec_data, ticker)
     
     # Data source status
     st.subheader("📊 Data Source Status")
@@ -82,69 +95,43 @@ def render_all_sources_tab(ticker: str):
         
         # Alpha Vantage row
         if market_data:
-            comparison_data.append({
-                "Source": "Alpha Vantage",
-                "Price": format_currency(market_data.get('regularMarketPrice')),
-                "Volume": format_number(market_data.get('regularMarketVolume')),
-                "Change": format_percentage(market_data.get('change_percent')),
-                "Market Cap": "N/A",
-                "PE Ratio": "N/A"
-            })
+            comparison_data.append((
+                "Alpha Vantage",
+                format_currency(market_data.get('regularMarketPrice')),
+                format_number(market_data.get('regularMarketVolume')),
+                format_percentage(market_data.get('change_percent')),
+                "N/A",
+                "N/A"
+            ))
         
         # Finnhub row
         if finnhub_data:
-            comparison_data.append({
-                "Source": "Finnhub",
-                "Price": format_currency(finnhub_data.get('regularMarketPrice')),
-                "Volume": format_number(finnhub_data.get('regularMarketVolume')),
-                "Change": format_percentage(finnhub_data.get('change_percent')),
-                "Market Cap": format_currency(finnhub_data.get('marketCap')),
-                "PE Ratio": "N/A"
-            })
+            comparison_data.append((
+                "Finnhub",
+                format_currency(finnhub_data.get('regularMarketPrice')),
+                format_number(finnhub_data.get('regularMarketVolume')),
+                format_percentage(finnhub_data.get('change_percent')),
+                format_currency(finnhub_data.get('marketCap')),
+                "N/A"
+            ))
         
         # SEC EDGAR row
         if sec_fundamentals:
-            comparison_data.append({
-                "Source": "SEC EDGAR",
-                "Price": "N/A",
-                "Volume": "N/A",
-                "Change": "N/A",
-                "Market Cap": "N/A",
-                "PE Ratio": f"{sec_fundamentals.trailing_pe:.2f}" if sec_fundamentals.trailing_pe else "N/A"
-            })
+            comparison_data.append((
+                "SEC EDGAR",
+                "N/A",
+                "N/A",
+                "N/A",
+                "N/A",
+                format_ratio(sec_fundamentals.trailing_pe)
+            ))
         
         if comparison_data:
-            df = pd.DataFrame(comparison_data)
+            # Every cell is pre-formatted text; an Arrow-backed string dtype hands Streamlit a ready Arrow column
+            df = pd.DataFrame(comparison_data, columns=_COMPARISON_COLUMNS, dtype="string[pyarrow]")
             st.dataframe(df, width='stretch')
     
-    # Data source advantages
-    st.subheader("ℹ️ Data Source Advantages")
-    
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.info("""
-        **Alpha Vantage**
-        - Real-time market data
-        - Global stock coverage
-        - Technical indicators
-        - Economic indicators
-        """)
-    
-    with col2:
-        st.info("""
-        **Finnhub**
-        - Real-time market data
-        - Company profiles & logos
-        - News & sentiment
-        - Financial statements
-        """)
-    
-    with col3:
-        st.info("""
-        **SEC EDGAR**
-        - Official filings
-        - Regulatory compliance
-        - Historical data
-        - Fundamental metrics
-        """)
+    # Data source advantages (static text, only sent when the user asks for it)
+    if st.toggle("ℹ️ Show data source advantages", key="show_source_advantages"):
+        for col, advantages in zip(st.columns(len(_SOURCE_ADVANTAGES)), _SOURCE_ADVANTAGES):
+            col.info(advantages)
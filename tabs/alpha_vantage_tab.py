@@ -1,10 +1,26 @@
 """Alpha Vantage Tab for Volur Dashboard."""
 
+import pandas as pd
 import streamlit as st
 from typing import Dict, Any, Optional
-from dashboard_utils import format_currency, format_number, format_percentage, get_cache_info, get_cached_alpha_vantage_data
+from dashboard_utils import (
+    format_currency, format_number, format_percentage, get_cache_info, get_cached_alpha_vantage_data,
+    display_raw_json
+)
 from tabs.base_tab import TickerDrivenTab
 
+# (section, label, formatter, quote field) for each row of the metrics table
+_METRICS = (
+    ("Price", "Current Price", format_currency, 'regularMarketPrice'),
+    ("Price", "Previous Close", format_currency, 'regularMarketPreviousClose'),
+    ("Price", "Day High", format_currency, 'regularMarketDayHigh'),
+    ("Price", "Day Low", format_currency, 'regularMarketDayLow'),
+    ("Market", "Open", format_currency, 'open'),
+    ("Market", "Change", format_currency, 'change'),
+    ("Market", "Change %", format_percentage, 'change_percent'),
+    ("Market", "Volume", format_number, 'regularMarketVolume'),
+)
+
 # Global tab instance
 alpha_vantage_tab = TickerDrivenTab("Alpha Vantage")
 
@@ -38,34 +54,17 @@ def render_alpha_vantage_tab(ticker: str):
         st.info("ℹ️ Data not cached - fetched fresh from API")
     
     if market_data:
-        # Price Information
-        st.subheader("💰 Price Information")
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("Current Price", format_currency(market_data.get('regularMarketPrice')))
-        with col2:
-            st.metric("Previous Close", format_currency(market_data.get('regularMarketPreviousClose')))
-        with col3:
-            st.metric("Day High", format_currency(market_data.get('regularMarketDayHigh')))
-        with col4:
-            st.metric("Day Low", format_currency(market_data.get('regularMarketDayLow')))
-        
-        # Additional Metrics
-        st.subheader("📊 Market Metrics")
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("Open", format_currency(market_data.get('open')))
-        with col2:
-            st.metric("Change", format_currency(market_data.get('change')))
-        with col3:
-            st.metric("Change %", format_percentage(market_data.get('change_percent')))
-        with col4:
-            st.metric("Volume", format_number(market_data.get('regularMarketVolume')))
+        # Price and market metrics in one table rather than a card per value
+        st.subheader("💰 Price & Market Metrics")
+        metrics_df = pd.DataFrame(
+            [(section, label, fmt(market_data.get(key))) for section, label, fmt, key in _METRICS],
+            columns=["Section", "Metric", "Value"],
+            dtype="string[pyarrow]",
+        )
+        st.dataframe(metrics_df, width='stretch', hide_index=True)
         
         # Raw data
         with st.expander("🔍 Raw Alpha Vantage Data"):
-            st.json(market_data)
+            display_raw_json(market_data, f"{ticker}_alpha_vantage.json")
     else:
         st.error("Could not retrieve Alpha Vantage data. Please check the ticker symbol and API key configuration.")
@@ -2,7 +2,7 @@
 
 import streamlit as st
 from typing import Dict, Any, Optional
-from event_system import subscribe_to_ticker_changes, Event, EventTypes
+from event_system import subscribe_to_ticker_changes, unsubscribe_from_ticker_changes, Event, EventTypes
 import logging
 
 logger = logging.getLogger(__name__)
@@ -10,17 +10,29 @@ logger = logging.getLogger(__name__)
 class TickerDrivenTab:
     """Base class for tabs that respond to ticker changes."""
     
+    # Subscribed instance per tab name, shared across reruns, sessions and module reloads
+    _subscribed: Dict[str, "TickerDrivenTab"] = {}
+    
     def __init__(self, tab_name: str):
         self.tab_name = tab_name
         self.current_ticker = None
-        self.subscribed = False
+    
+    @property
+    def subscribed(self) -> bool:
+        """Whether this instance is the one receiving ticker change events."""
+        return TickerDrivenTab._subscribed.get(self.tab_name) is self
     
     def subscribe_to_events(self):
-        """Subscribe to ticker change events."""
-        if not self.subscribed:
-            subscribe_to_ticker_changes(self._on_ticker_changed)
-            self.subscribed = True
-            logger.info(f"{self.tab_name} subscribed to ticker change events")
+        """Subscribe to ticker change events, replacing any stale instance of this tab."""
+        if self.subscribed:
+            return
+        stale = TickerDrivenTab._subscribed.get(self.tab_name)
+        if stale is not None:
+            # The tab module was reloaded; drop the old instance's callback
+            unsubscribe_from_ticker_changes(stale._on_ticker_changed)
+        subscribe_to_ticker_changes(self._on_ticker_changed)
+        TickerDrivenTab._subscribed[self.tab_name] = self
+        logger.info(f"{self.tab_name} subscribed to ticker change events")
     
     def _on_ticker_changed(self, event: Event):
         """Handle ticker changed event."""
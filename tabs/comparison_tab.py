@@ -3,8 +3,52 @@
 import streamlit as st
 import pandas as pd
 from typing import Dict, Any, Optional
-from volur.plugins.base import Fundamentals
-from dashboard_utils import format_currency, format_number, format_percentage
+from dashboard_utils import (
+    format_currency, format_number, format_percentage, format_ratio, fetch_concurrently,
+    get_cached_alpha_vantage_data, get_cached_finnhub_data, get_cached_sec_data, sec_data_to_fundamentals
+)
+
+
+# (metric, gating source, formatter, Alpha Vantage key, Finnhub key, SEC Fundamentals attribute)
+_COMPARISON_ROWS = (
+    ("Current Price", "av", format_currency, 'regularMarketPrice', 'regularMarketPrice', None),
+    ("Volume", "av", format_number, 'regularMarketVolume', 'regularMarketVolume', None),
+    ("Change %", "av", format_percentage, 'change_percent', 'change_percent', None),
+    ("Market Cap", "fh", format_currency, None, 'marketCap', None),
+    ("Shares Outstanding", "fh", format_number, None, 'sharesOutstanding', None),
+    ("Revenue", "sec", format_currency, None, None, 'revenue'),
+    ("Free Cash Flow", "sec", format_currency, None, None, 'free_cash_flow'),
+    ("Operating Margin", "sec", format_percentage, None, None, 'operating_margin'),
+    ("Trailing PE", "sec", format_ratio, None, None, 'trailing_pe'),
+    ("ROE", "sec", format_percentage, None, None, 'roe'),
+    ("ROA", "sec", format_percentage, None, None, 'roa'),
+)
+_COMPARISON_COLUMNS = ["Metric", "Alpha Vantage", "Finnhub", "SEC EDGAR"]
+
+# Info card text for each source, shown side by side
+_SOURCE_STRENGTHS = (
+    """
+    **Alpha Vantage**
+    - Real-time quotes
+    - Volume data
+    - Price changes
+    - Technical indicators
+    """,
+    """
+    **Finnhub**
+    - Real-time quotes
+    - Company profiles
+    - Market cap data
+    - News & sentiment
+    """,
+    """
+    **SEC EDGAR**
+    - Official filings
+    - Revenue data
+    - Cash flow metrics
+    - Financial ratios
+    """,
+)
 
 
 def render_comparison_tab(ticker: str):
@@ -15,161 +59,46 @@ def render_comparison_tab(ticker: str):
     col1, col2 = st.columns([3, 1])
     with col2:
         if st.button("🔄 Refresh Comparison", key="refresh_comparison"):
-            from dashboard_utils import get_cached_alpha_vantage_data, get_cached_finnhub_data, get_cached_sec_data
-            market_data = get_cached_alpha_vantage_data(ticker, force_refresh=True)
-            finnhub_data = get_cached_finnhub_data(ticker, force_refresh=True)
-            sec_data = get_cached_sec_data(ticker, force_refresh=True)
+            fetch_concurrently(
+                ticker, get_cached_alpha_vantage_data, get_cached_finnhub_data, get_cached_sec_data,
+                force_refresh=True
+            )
             st.success("Comparison data refreshed!")
             st.rerun()
     
     # Fetch data for this tab
-    from dashboard_utils import get_cached_alpha_vantage_data, get_cached_finnhub_data, get_cached_sec_data
-    market_data = get_cached_alpha_vantage_data(ticker)
-    finnhub_data = get_cached_finnhub_data(ticker)
-    sec_data = get_cached_sec_data(ticker)
+    market_data, finnhub_data, sec_data = fetch_concurrently(
+        ticker, get_cached_alpha_vantage_data, get_cached_finnhub_data, get_cached_sec_data
+    )
     
     # Convert SEC data to Fundamentals object if available
-    sec_fundamentals = None
-    if sec_data:
-        from volur.plugins.base import Fundamentals
-        sec_fundamentals = Fundamentals(
-            ticker=sec_data.get("ticker", ticker),
-            trailing_pe=sec_data.get("trailing_pe"),
-            price_to_book=sec_data.get("price_to_book"),
-            roe=sec_data.get("roe"),
-            roa=sec_data.get("roa"),
-            debt_to_equity=sec_data.get("debt_to_equity"),
-            free_cash_flow=sec_data.get("free_cash_flow"),
-            revenue=sec_data.get("revenue"),
-            operating_margin=sec_data.get("operating_margin"),
-            sector=sec_data.get("sector"),
-            name=sec_data.get("name")
-        )
+    sec_fundamentals = sec_data_to_fundamentals(sec_data, ticker)
     
     if market_data or finnhub_data or sec_fundamentals:
         st.subheader("📈 Financial Metrics Comparison")
         
-        # Create comparison data
-        comparison_data = []
-        
-        # Alpha Vantage data
-        if market_data:
-            comparison_data.append({
-                "Metric": "Current Price",
-                "Alpha Vantage": format_currency(market_data.get('regularMarketPrice')),
-                "Finnhub": format_currency(finnhub_data.get('regularMarketPrice')) if finnhub_data else "N/A",
-                "SEC EDGAR": "N/A"
-            })
-            
-            comparison_data.append({
-                "Metric": "Volume",
-                "Alpha Vantage": format_number(market_data.get('regularMarketVolume')),
-                "Finnhub": format_number(finnhub_data.get('regularMarketVolume')) if finnhub_data else "N/A",
-                "SEC EDGAR": "N/A"
-            })
-            
-            comparison_data.append({
-                "Metric": "Change %",
-                "Alpha Vantage": format_percentage(market_data.get('change_percent')),
-                "Finnhub": format_percentage(finnhub_data.get('change_percent')) if finnhub_data else "N/A",
-                "SEC EDGAR": "N/A"
-            })
-        
-        # Finnhub-specific data
-        if finnhub_data:
-            comparison_data.append({
-                "Metric": "Market Cap",
-                "Alpha Vantage": "N/A",
-                "Finnhub": format_currency(finnhub_data.get('marketCap')),
-                "SEC EDGAR": "N/A"
-            })
-            
-            comparison_data.append({
-                "Metric": "Shares Outstanding",
-                "Alpha Vantage": "N/A",
-                "Finnhub": format_number(finnhub_data.get('sharesOutstanding')),
-                "SEC EDGAR": "N/A"
-            })
-        
-        # SEC EDGAR data
-        if sec_fundamentals:
-            comparison_data.append({
-                "Metric": "Revenue",
-                "Alpha Vantage": "N/A",
-                "Finnhub": "N/A",
-                "SEC EDGAR": format_currency(sec_fundamentals.revenue)
-            })
-            
-            comparison_data.append({
-                "Metric": "Free Cash Flow",
-                "Alpha Vantage": "N/A",
-                "Finnhub": "N/A",
-                "SEC EDGAR": format_currency(sec_fundamentals.free_cash_flow)
-            })
-            
-            comparison_data.append({
-                "Metric": "Operating Margin",
-                "Alpha Vantage": "N/A",
-                "Finnhub": "N/A",
-                "SEC EDGAR": format_percentage(sec_fundamentals.operating_margin)
-            })
-            
-            comparison_data.append({
-                "Metric": "Trailing PE",
-                "Alpha Vantage": "N/A",
-                "Finnhub": "N/A",
-                "SEC EDGAR": f"{sec_fundamentals.trailing_pe:.2f}" if sec_fundamentals.trailing_pe else "N/A"
-            })
-            
-            comparison_data.append({
-                "Metric": "ROE",
-                "Alpha Vantage": "N/A",
-                "Finnhub": "N/A",
-                "SEC EDGAR": format_percentage(sec_fundamentals.roe)
-            })
-            
-            comparison_data.append({
-                "Metric": "ROA",
-                "Alpha Vantage": "N/A",
-                "Finnhub": "N/A",
-                "SEC EDGAR": format_percentage(sec_fundamentals.roa)
-            })
+        # One row per spec entry whose gating source is available; other sources fill in where they have the field
+        present = {"av": bool(market_data), "fh": bool(finnhub_data), "sec": sec_fundamentals is not None}
+        comparison_data = [
+            (
+                metric,
+                fmt(market_data.get(av_key)) if av_key and market_data else "N/A",
+                fmt(finnhub_data.get(fh_key)) if fh_key and finnhub_data else "N/A",
+                fmt(getattr(sec_fundamentals, sec_attr)) if sec_attr and sec_fundamentals else "N/A",
+            )
+            for metric, gate, fmt, av_key, fh_key, sec_attr in _COMPARISON_ROWS
+            if present[gate]
+        ]
         
         if comparison_data:
-            df = pd.DataFrame(comparison_data)
+            # Every cell is pre-formatted text; an Arrow-backed string dtype hands Streamlit a ready Arrow column
+            df = pd.DataFrame(comparison_data, columns=_COMPARISON_COLUMNS, dtype="string[pyarrow]")
             st.dataframe(df, width='stretch')
         
-        # Data source comparison
-        st.subheader("📊 Data Source Comparison")
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.info("""
-            **Alpha Vantage**
-            - Real-time quotes
-            - Volume data
-            - Price changes
-            - Technical indicators
-            """)
-        
-        with col2:
-            st.info("""
-            **Finnhub**
-            - Real-time quotes
-            - Company profiles
-            - Market cap data
-            - News & sentiment
-            """)
-        
-        with col3:
-            st.info("""
-            **SEC EDGAR**
-            - Official filings
-            - Revenue data
-            - Cash flow metrics
-            - Financial ratios
-            """)
+        # Data source comparison (static text, only sent when the user asks for it)
+        if st.toggle("📊 Show data source comparison", key="show_source_strengths"):
+            for col, strengths in zip(st.columns(len(_SOURCE_STRENGTHS)), _SOURCE_STRENGTHS):
+                col.info(strengths)
         
         # Recommendations
         st.subheader("💡 Recommendations")
@@ -2,55 +2,109 @@
 
 import streamlit as st
 import os
+from datetime import datetime
+from typing import Tuple
 
 
+_LOG_FILE = 'volur_dashboard.log'
+# Only the last lines of the log are read and shown, read backwards in blocks up to a byte ceiling
+_LOG_TAIL_LINES = 2000
+_LOG_READ_BLOCK = 64 * 1024
+_LOG_TAIL_MAX_BYTES = 4 * 1024 * 1024
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _tail_log(mtime_ns: int, size: int, n_lines: int = _LOG_TAIL_LINES) -> Tuple[str, bool]:
+    """Read the last n_lines lines of the log file, and whether earlier lines were left out.
+
+    The file's mtime and size are only part of the cache key, so the tail is re-read
+    only when the log changes.
+    """
+    chunks = []
+    newlines = 0
+    start = size
+    with open(_LOG_FILE, 'rb') as f:
+        while start > 0 and newlines <= n_lines and size - start < _LOG_TAIL_MAX_BYTES:
+            end, start = start, max(0, start - _LOG_READ_BLOCK)
+            f.seek(start)
+            chunk = f.read(end - start)
+            chunks.append(chunk)
+            newlines += chunk.count(b'\n')
+    lines = b''.join(reversed(chunks)).decode('utf-8', 'replace').splitlines()
+    if start:
+        # Drop the partial first line
+        lines = lines[1:]
+    return '\n'.join(lines[-n_lines:]), bool(start) or len(lines) > n_lines
+
+
+def _clear_logs():
+    """Truncate the log file, leaving the outcome for the next render to report."""
+    try:
+        with open(_LOG_FILE, 'w') as f:
+            f.write("")
+        st.session_state['_clear_logs_message'] = "Logs cleared successfully!"
+    except Exception as e:
+        st.session_state['_clear_logs_message'] = f"Error clearing logs: {e}"
+
+
+@st.fragment
 def render_debug_logs_tab():
-    """Render the Debug Logs tab."""
+    """Render the Debug Logs tab.
+
+    Runs as a fragment so the Clear Logs button reruns only this tab.
+    """
     st.header("🐛 Debug Logs")
     st.markdown("Real-time logging information for debugging issues")
     
-    # Show recent log entries
+    clear_logs_message = st.session_state.pop('_clear_logs_message', None)
+    if clear_logs_message:
+        st.toast(clear_logs_message)
+    
+    # Stat the log once for both the tail and the file info
     try:
-        with open('volur_dashboard.log', 'r') as f:
-            log_content = f.read()
-            
-        if log_content:
-            st.subheader("📋 Recent Log Entries")
-            st.text_area("Log Content", log_content, height=400)
-        else:
-            st.info("No log entries found.")
-            
+        stat = os.stat(_LOG_FILE)
     except FileNotFoundError:
-        st.warning("Log file not found. Logging may not be configured.")
+        stat = None
     except Exception as e:
-        st.error(f"Error reading log file: {e}")
+        stat = None
+        st.error(f"Error getting log file info: {e}")
+    
+    # Show recent log entries
+    if stat is None:
+        st.warning("Log file not found. Logging may not be configured.")
+    else:
+        try:
+            tail_lines = st.number_input(
+                "Tail lines", min_value=100, max_value=20000, value=_LOG_TAIL_LINES, step=100, key="log_tail_lines"
+            )
+            log_content, truncated = _tail_log(stat.st_mtime_ns, stat.st_size, tail_lines)
+            
+            if log_content:
+                st.subheader("📋 Recent Log Entries")
+                if truncated:
+                    st.caption(f"Showing the last {tail_lines:,} lines of a {stat.st_size:,} byte log")
+                st.text_area("Log Content", log_content, height=400)
+            else:
+                st.info("No log entries found.")
+                
+        except Exception as e:
+            st.error(f"Error reading log file: {e}")
     
     # Log file info
     st.subheader("📁 Log File Information")
     
-    try:
-        if os.path.exists('volur_dashboard.log'):
-            stat = os.stat('volur_dashboard.log')
-            st.info(f"""
-            **Log File Status:**
-            - File exists: ✅
-            - Size: {stat.st_size} bytes
-            - Last modified: {stat.st_mtime}
-            """)
-        else:
-            st.warning("Log file does not exist.")
-    except Exception as e:
-        st.error(f"Error getting log file info: {e}")
+    if stat is not None:
+        st.info(f"""
+        **Log File Status:**
+        - File exists: ✅
+        - Size: {stat.st_size} bytes
+        - Last modified: {datetime.fromtimestamp(stat.st_mtime):%Y-%m-%d %H:%M:%S}
+        """)
+    else:
+        st.warning("Log file does not exist.")
     
-    # Clear logs button
-    if st.button("🗑️ Clear Logs"):
-        try:
-            with open('volur_dashboard.log', 'w') as f:
-                f.write("")
-            st.success("Logs cleared successfully!")
-            st.rerun()
-        except Exception as e:
-            st.error(f"Error clearing logs: {e}")
+    # Clear logs button; the callback runs before the fragment re-renders, so the view is already empty
+    st.button("🗑️ Clear Logs", on_click=_clear_logs)
     
     # Logging configuration info
     st.subheader("⚙️ Logging Configuration")
@@ -1,135 +1,204 @@
 """Finnhub Basic Financials Tab for Volur Dashboard."""
 
+import re
 import streamlit as st
 import pandas as pd
-from typing import Dict, Any, List
-from dashboard_utils import format_currency, format_number, format_percentage
+from functools import lru_cache
+from typing import Callable, Dict, Any, List, Tuple
+from dashboard_utils import (
+    format_currency, format_number, format_percentage, display_raw_json, get_cached_finnhub_basic_financials
+)
 
+# Substrings of a metric key that select its formatting, checked in this order
+_RATIO_KEYWORDS = ('ratio', 'margin', 'yield', 'return', 'pe', 'pb', 'ps', 'pcf', 'roe', 'roa', 'roic')
+_CURRENCY_KEYWORDS = (
+    'capitalization', 'enterprise', 'marketcap', 'revenue', 'income', 'assets', 'equity', 'eps', 'bookvalue', 'cashflow'
+)
 
-def display_metric_section(metrics: Dict[str, Any], section_name: str, section_icon: str):
-    """Display a section of financial metrics."""
+# (section, icon, key substrings) in display order; a metric goes to the first section that matches
+_OTHER_CATEGORY = "Other Metrics"
+_METRIC_CATEGORIES = (
+    ("Valuation Metrics", "💰", ('pe', 'pb', 'ps', 'pcf', 'ev', 'marketcap', 'enterprise')),
+    ("Profitability Metrics", "📈", ('margin', 'roe', 'roa', 'roic', 'return')),
+    ("Liquidity Metrics", "💧", ('current', 'quick', 'cash')),
+    ("Leverage Metrics", "⚖️", ('debt', 'equity', 'leverage')),
+    ("Efficiency Metrics", "⚡", ('turnover', 'efficiency', 'per_share')),
+    (_OTHER_CATEGORY, "📋", ()),
+)
+# One compiled alternation per category, tried in order. A single combined pattern would pick the
+# leftmost match instead (e.g. 'cash' over 'pe' in cashFlowPerShareTTM), changing the categorization.
+_METRIC_CATEGORY_PATTERNS = tuple(
+    (name, re.compile("|".join(map(re.escape, keywords))))
+    for name, _, keywords in _METRIC_CATEGORIES
+    if keywords
+)
+
+# Common key metrics for the summary, keyed by Finnhub metric name
+_KEY_METRIC_NAMES = {
+    'marketCapitalization': 'Market Cap',
+    'enterpriseValue': 'Enterprise Value',
+    'peTTM': 'P/E Ratio (TTM)',
+    'pb': 'P/B Ratio',
+    'psTTM': 'P/S Ratio (TTM)',
+    'pcfShareTTM': 'P/CF Ratio (TTM)',
+    'evEbitdaTTM': 'EV/EBITDA (TTM)',
+    'roeTTM': 'ROE (TTM)',
+    'roaTTM': 'ROA (TTM)',
+    'roicTTM': 'ROIC (TTM)',
+    'grossMarginTTM': 'Gross Margin (TTM)',
+    'operatingMarginTTM': 'Operating Margin (TTM)',
+    'netProfitMarginTTM': 'Net Margin (TTM)',
+    'longTermDebt/equityQuarterly': 'Debt/Equity',
+    'currentRatioQuarterly': 'Current Ratio',
+    'quickRatioQuarterly': 'Quick Ratio',
+    'revenuePerShareTTM': 'Revenue/Share (TTM)',
+    'epsTTM': 'EPS (TTM)',
+    'bookValuePerShareQuarterly': 'Book Value/Share',
+    'cashFlowPerShareTTM': 'Cash Flow/Share (TTM)'
+}
+# The summary shows at most this many key metrics
+_SUMMARY_METRIC_LIMIT = 12
+
+# Historical series shown for each period type
+_ANNUAL_SERIES = ('revenue', 'netIncome', 'totalAssets', 'totalEquity', 'eps')
+_QUARTERLY_SERIES = ('revenue', 'netIncome', 'totalAssets', 'totalEquity')
+
+# Metric tables have a fixed two-column schema, so size them up front
+_METRIC_TABLE_WIDTH = 520
+_METRIC_COLUMN_CONFIG = {
+    "Metric": st.column_config.TextColumn(width="medium"),
+    "Formatted Value": st.column_config.TextColumn(width="small"),
+}
+
+
+def display_metric_section(rows: List[Tuple[str, str]], section_name: str, section_icon: str):
+    """Display a section of (metric, formatted value) rows."""
     st.subheader(f"{section_icon} {section_name}")
     
-    if not metrics:
-        st.info(f"No {section_name.lower()} data available")
-        return
+    if rows:
+        df = pd.DataFrame(rows, columns=("Metric", "Formatted Value"), dtype="string[pyarrow]")
+        st.dataframe(df, width=_METRIC_TABLE_WIDTH, hide_index=True, column_config=_METRIC_COLUMN_CONFIG)
+    else:
+        st.info(f"No data available for {section_name}")
+
+
+@lru_cache(maxsize=1024)
+def _number_formatter(key: str) -> Callable[[float], str]:
+    """Pick the number formatter for a metric key; keys repeat across series points and payloads."""
+    lower_key = key.lower()
+    
+    # Financial ratios and percentages
+    if any(keyword in lower_key for keyword in _RATIO_KEYWORDS):
+        return _format_ratio_value
     
-    # Convert metrics to DataFrame for better display
-    df_data = []
-    for key, value in metrics.items():
-        if value is not None:
-            # Format the key name for display
-            display_key = key.replace('_', ' ').title()
-            df_data.append({
-                "Metric": display_key,
-                "Value": value,
-                "Formatted Value": format_metric_value(key, value)
-            })
+    # Currency values (large numbers)
+    elif any(keyword in lower_key for keyword in _CURRENCY_KEYWORDS):
+        return format_currency
     
-    if df_data:
-        df = pd.DataFrame(df_data)
-        st.dataframe(df[['Metric', 'Formatted Value']], width='stretch', hide_index=True)
+    # Small numbers
     else:
-        st.info(f"No data available for {section_name}")
+        return "{:.2f}".format
+
+
+def _format_ratio_value(value: float) -> str:
+    """Show small ratios with four decimals, others with two."""
+    if abs(value) < 1:
+        return f"{value:.4f}"
+    else:
+        return f"{value:.2f}"
 
 
 def format_metric_value(key: str, value: Any) -> str:
     """Format metric values based on their type and key."""
+    # Scalars are hashable, so repeated (key, value) pairs come straight from the cache
+    if value is None or isinstance(value, (int, float, str)):
+        return _format_scalar_metric(key, value)
+    
+    # Other types
+    return str(value)
+
+
+@lru_cache(maxsize=4096)
+def _format_scalar_metric(key: str, value: Any) -> str:
+    """Format a None, numeric or string metric value."""
     if value is None:
         return "N/A"
     
     # Handle different metric types
     if isinstance(value, (int, float)):
-        # Financial ratios and percentages
-        if any(keyword in key.lower() for keyword in ['ratio', 'margin', 'yield', 'return', 'pe', 'pb', 'ps', 'pcf', 'roe', 'roa', 'roic']):
-            if abs(value) < 1:
-                return f"{value:.4f}"
-            else:
-                return f"{value:.2f}"
-        
-        # Currency values (large numbers)
-        elif any(keyword in key.lower() for keyword in ['capitalization', 'enterprise', 'marketcap', 'revenue', 'income', 'assets', 'equity', 'eps', 'bookvalue', 'cashflow']):
-            return format_currency(value)
-        
-        # Small numbers
-        else:
-            return f"{value:.2f}"
+        return _number_formatter(key)(value)
     
     # String values
-    elif isinstance(value, str):
-        return value
-    
-    # Other types
-    else:
-        return str(value)
+    return value
 
 
-def display_key_metrics_summary(basic_financials_data: Dict[str, Any]):
+def display_key_metrics_summary(key_metrics: List[Tuple[str, str]]):
     """Display a summary of key financial metrics."""
     st.subheader("📈 Key Financial Metrics Summary")
     
-    if not basic_financials_data or 'metric' not in basic_financials_data:
-        st.info("No basic financials data available")
-        return
+    if key_metrics:
+        df = pd.DataFrame(
+            key_metrics[:_SUMMARY_METRIC_LIMIT], columns=("Metric", "Formatted Value"), dtype="string[pyarrow]"
+        )
+        st.dataframe(df, width=_METRIC_TABLE_WIDTH, hide_index=True, column_config=_METRIC_COLUMN_CONFIG)
+    else:
+        st.info("No key metrics found in the basic financials data")
+
+
+def _series_rows(series: Dict[str, Any], metrics: Tuple[str, ...]) -> List[Tuple[str, List[Tuple[str, str]]]]:
+    """Format the (period, value) rows of each historical series that has data."""
+    return [
+        (metric, [(dp.get('period', 'N/A'), format_metric_value(metric, dp.get('v'))) for dp in series[metric]])
+        for metric in metrics
+        if series.get(metric)
+    ]
+
+
+@st.cache_data(ttl=300, max_entries=128)
+def _prepare_basic_financials(ticker: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Categorize and format a basic financials payload into plain display rows.
     
-    # Extract metrics from the 'metric' key
-    metrics = basic_financials_data.get('metric', {})
+    Reruns with the same payload reuse the result instead of re-running the categorization
+    and formatting loops.
+    """
+    metrics = payload.get('metric') or {}
     
-    # Common key metrics to display
-    metric_mappings = {
-        'marketCapitalization': 'Market Cap',
-        'enterpriseValue': 'Enterprise Value',
-        'peTTM': 'P/E Ratio (TTM)',
-        'pb': 'P/B Ratio',
-        'psTTM': 'P/S Ratio (TTM)',
-        'pcfShareTTM': 'P/CF Ratio (TTM)',
-        'evEbitdaTTM': 'EV/EBITDA (TTM)',
-        'roeTTM': 'ROE (TTM)',
-        'roaTTM': 'ROA (TTM)',
-        'roicTTM': 'ROIC (TTM)',
-        'grossMarginTTM': 'Gross Margin (TTM)',
-        'operatingMarginTTM': 'Operating Margin (TTM)',
-        'netProfitMarginTTM': 'Net Margin (TTM)',
-        'longTermDebt/equityQuarterly': 'Debt/Equity',
-        'currentRatioQuarterly': 'Current Ratio',
-        'quickRatioQuarterly': 'Quick Ratio',
-        'revenuePerShareTTM': 'Revenue/Share (TTM)',
-        'epsTTM': 'EPS (TTM)',
-        'bookValuePerShareQuarterly': 'Book Value/Share',
-        'cashFlowPerShareTTM': 'Cash Flow/Share (TTM)'
-    }
+    key_metrics = [
+        (display_name, format_metric_value(display_name.lower().replace(' ', ''), metrics[key]))
+        for key, display_name in _KEY_METRIC_NAMES.items()
+        if metrics.get(key) is not None
+    ]
     
-    # Extract metrics from the data
-    key_metrics = {}
-    for key, display_name in metric_mappings.items():
-        if key in metrics and metrics[key] is not None:
-            key_metrics[display_name] = metrics[key]
+    # Categorize metrics; each goes to the first category with a matching keyword
+    sections = {name: [] for name, _, _ in _METRIC_CATEGORIES}
+    for key, value in metrics.items():
+        if value is None:
+            continue
+        key_lower = key.lower()
+        section = next(
+            (name for name, pattern in _METRIC_CATEGORY_PATTERNS if pattern.search(key_lower)),
+            _OTHER_CATEGORY,
+        )
+        sections[section].append((key.replace('_', ' ').title(), format_metric_value(key, value)))
     
-    if key_metrics:
-        # Display in columns
-        col1, col2, col3, col4 = st.columns(4)
-        metrics_list = list(key_metrics.items())
-        
-        for i, (name, value) in enumerate(metrics_list[:4]):
-            with [col1, col2, col3, col4][i]:
-                formatted_value = format_metric_value(name.lower().replace(' ', ''), value)
-                st.metric(name, formatted_value)
-        
-        if len(metrics_list) > 4:
-            col5, col6, col7, col8 = st.columns(4)
-            for i, (name, value) in enumerate(metrics_list[4:8]):
-                with [col5, col6, col7, col8][i]:
-                    formatted_value = format_metric_value(name.lower().replace(' ', ''), value)
-                    st.metric(name, formatted_value)
-        
-        if len(metrics_list) > 8:
-            col9, col10, col11, col12 = st.columns(4)
-            for i, (name, value) in enumerate(metrics_list[8:12]):
-                with [col9, col10, col11, col12][i]:
-                    formatted_value = format_metric_value(name.lower().replace(' ', ''), value)
-                    st.metric(name, formatted_value)
-    else:
-        st.info("No key metrics found in the basic financials data")
+    series = payload.get('series') or {}
+    return {
+        "key_metrics": key_metrics,
+        "sections": [(name, icon, sections[name]) for name, icon, _ in _METRIC_CATEGORIES],
+        "has_series": 'series' in payload,
+        "annual": _series_rows(series['annual'], _ANNUAL_SERIES) if 'annual' in series else None,
+        "quarterly": _series_rows(series['quarterly'], _QUARTERLY_SERIES) if 'quarterly' in series else None,
+    }
+
+
+def _display_series(label: str, series_rows: List[Tuple[str, List[Tuple[str, str]]]]):
+    """Display a table per historical series."""
+    st.markdown(f"**{label}**")
+    for metric, rows in series_rows:
+        st.markdown(f"**{metric.replace('_', ' ').title()}**")
+        if rows:
+            df = pd.DataFrame(rows, columns=("Period", "Value"), dtype="string[pyarrow]")
+            st.dataframe(df, width='stretch', hide_index=True)
 
 
 def render_finnhub_basic_financials_tab(ticker: str):
@@ -140,137 +209,38 @@ def render_finnhub_basic_financials_tab(ticker: str):
     col1, col2 = st.columns([3, 1])
     with col2:
         if st.button("🔄 Refresh Basic Financials", key="refresh_finnhub_basic_financials"):
-            from dashboard_utils import get_cached_finnhub_basic_financials
             basic_financials_data = get_cached_finnhub_basic_financials(ticker, force_refresh=True)
             st.success("Finnhub basic financials refreshed!")
             st.rerun()
     
     # Fetch data for this tab
-    from dashboard_utils import get_cached_finnhub_basic_financials
     basic_financials_data = get_cached_finnhub_basic_financials(ticker)
     
-    if basic_financials_data and 'metric' in basic_financials_data:
+    if basic_financials_data and basic_financials_data.get('metric'):
+        prepared = _prepare_basic_financials(ticker, basic_financials_data)
+        
         # Display key metrics summary
-        display_key_metrics_summary(basic_financials_data)
+        display_key_metrics_summary(prepared["key_metrics"])
         
         st.divider()
         
-        # Get metrics from the nested structure
-        metrics = basic_financials_data.get('metric', {})
-        
-        # Categorize metrics by type
-        valuation_metrics = {}
-        profitability_metrics = {}
-        liquidity_metrics = {}
-        leverage_metrics = {}
-        efficiency_metrics = {}
-        other_metrics = {}
-        
-        # Categorize metrics
-        for key, value in metrics.items():
-            if value is not None:
-                key_lower = key.lower()
-                
-                # Valuation metrics
-                if any(keyword in key_lower for keyword in ['pe', 'pb', 'ps', 'pcf', 'ev', 'marketcap', 'enterprise']):
-                    valuation_metrics[key] = value
-                
-                # Profitability metrics
-                elif any(keyword in key_lower for keyword in ['margin', 'roe', 'roa', 'roic', 'return']):
-                    profitability_metrics[key] = value
-                
-                # Liquidity metrics
-                elif any(keyword in key_lower for keyword in ['current', 'quick', 'cash']):
-                    liquidity_metrics[key] = value
-                
-                # Leverage metrics
-                elif any(keyword in key_lower for keyword in ['debt', 'equity', 'leverage']):
-                    leverage_metrics[key] = value
-                
-                # Efficiency metrics
-                elif any(keyword in key_lower for keyword in ['turnover', 'efficiency', 'per_share']):
-                    efficiency_metrics[key] = value
-                
-                # Other metrics
-                else:
-                    other_metrics[key] = value
-        
         # Display categorized metrics
-        if valuation_metrics:
-            display_metric_section(valuation_metrics, "Valuation Metrics", "💰")
-            st.divider()
-        
-        if profitability_metrics:
-            display_metric_section(profitability_metrics, "Profitability Metrics", "📈")
-            st.divider()
-        
-        if liquidity_metrics:
-            display_metric_section(liquidity_metrics, "Liquidity Metrics", "💧")
-            st.divider()
-        
-        if leverage_metrics:
-            display_metric_section(leverage_metrics, "Leverage Metrics", "⚖️")
-            st.divider()
-        
-        if efficiency_metrics:
-            display_metric_section(efficiency_metrics, "Efficiency Metrics", "⚡")
-            st.divider()
-        
-        if other_metrics:
-            display_metric_section(other_metrics, "Other Metrics", "📋")
-            st.divider()
+        for name, icon, rows in prepared["sections"]:
+            if rows:
+                display_metric_section(rows, name, icon)
+                st.divider()
         
         # Historical data section
-        if 'series' in basic_financials_data:
+        if prepared["has_series"]:
             st.subheader("📊 Historical Data")
-            
-            series_data = basic_financials_data['series']
-            
-            # Annual data
-            if 'annual' in series_data:
-                st.markdown("**Annual Data**")
-                annual_data = series_data['annual']
-                
-                # Display key annual metrics
-                key_annual_metrics = ['revenue', 'netIncome', 'totalAssets', 'totalEquity', 'eps']
-                for metric in key_annual_metrics:
-                    if metric in annual_data and annual_data[metric]:
-                        st.markdown(f"**{metric.replace('_', ' ').title()}**")
-                        df_data = []
-                        for dp in annual_data[metric]:
-                            value = dp.get('v')
-                            formatted_value = format_metric_value(metric, value)
-                            df_data.append({
-                                "Period": dp.get('period', 'N/A'),
-                                "Value": formatted_value
-                            })
-                        if df_data:
-                            st.dataframe(df_data, width='stretch', hide_index=True)
-            
-            # Quarterly data
-            if 'quarterly' in series_data:
-                st.markdown("**Quarterly Data**")
-                quarterly_data = series_data['quarterly']
-                
-                # Display key quarterly metrics
-                key_quarterly_metrics = ['revenue', 'netIncome', 'totalAssets', 'totalEquity']
-                for metric in key_quarterly_metrics:
-                    if metric in quarterly_data and quarterly_data[metric]:
-                        st.markdown(f"**{metric.replace('_', ' ').title()}**")
-                        df_data = []
-                        for dp in quarterly_data[metric]:
-                            value = dp.get('v')
-                            formatted_value = format_metric_value(metric, value)
-                            df_data.append({
-                                "Period": dp.get('period', 'N/A'),
-                                "Value": formatted_value
-                            })
-                        if df_data:
-                            st.dataframe(df_data, width='stretch', hide_index=True)
+            if prepared["annual"] is not None:
+                _display_series("Annual Data", prepared["annual"])
+            if prepared["quarterly"] is not None:
+                _display_series("Quarterly Data", prepared["quarterly"])
         
         # Raw data section
         with st.expander("🔍 Raw Basic Financials Data"):
-            st.json(basic_financials_data)
+            display_raw_json(basic_financials_data, f"{ticker}_finnhub_basic_financials.json")
             
     else:
         st.error("Could not retrieve Finnhub basic financials. Please check the ticker symbol and API key configuration.")
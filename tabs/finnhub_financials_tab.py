@@ -1,9 +1,58 @@
 """Finnhub Financials Tab for Volur Dashboard."""
 
+import re
 import streamlit as st
 import pandas as pd
 from typing import Dict, Any, List
-from dashboard_utils import format_currency, format_number, format_percentage
+from dashboard_utils import (
+    format_currency, format_number, format_percentage, display_raw_json, get_cached_finnhub_financials
+)
+
+# Units shown as plain counts rather than currency
+_COUNT_UNITS = ("shares", "USD/shares")
+
+# Summary labels for the us-gaap concepts Finnhub reports, keyed by statement and the lowercased
+# concept name without its taxonomy prefix
+_CONCEPT_LABELS = {
+    'ic': {
+        'revenues': 'Revenue',
+        'revenuefromcontractwithcustomerexcludingassessedtax': 'Revenue',
+        'salesrevenuenet': 'Revenue',
+        'netincomeloss': 'Net Income',
+        'operatingincomeloss': 'Operating Income',
+        'grossprofit': 'Gross Profit',
+    },
+    'bs': {
+        'assets': 'Total Assets',
+        'liabilities': 'Total Liabilities',
+        'stockholdersequity': 'Shareholders Equity',
+    },
+    'cf': {
+        'netcashprovidedbyusedinoperatingactivities': 'Operating Cash Flow',
+    },
+}
+
+# (statement, ((summary label, concept pattern), ...)) for concepts not in _CONCEPT_LABELS.
+# Patterns are anchored lookaheads so each is one match() call regardless of word order.
+_SUMMARY_RULES = tuple(
+    (statement, tuple((label, re.compile(pattern)) for label, pattern in rules))
+    for statement, rules in (
+        ('ic', (
+            ('Revenue', r'^(?=.*revenue)(?=.*contract)'),
+            ('Net Income', r'^(?=.*net income)(?=.*loss)'),
+            ('Operating Income', r'^(?=.*operating income)(?=.*loss)'),
+            ('Gross Profit', r'^(?=.*gross profit)'),
+        )),
+        ('bs', (
+            ('Total Assets', r'^(?=.*assets)(?=.*total)(?!.*current)'),
+            ('Total Liabilities', r'^(?=.*liabilities)(?=.*total)(?!.*current)'),
+            ('Shareholders Equity', r'^(?=.*(?:stockholders|shareholders) equity)'),
+        )),
+        ('cf', (
+            ('Operating Cash Flow', r'^(?=.*operating activities)(?=.*net cash)'),
+        )),
+    )
+)
 
 
 def display_financial_statement(statement_data: Dict[str, Any], statement_name: str):
@@ -14,38 +63,30 @@ def display_financial_statement(statement_data: Dict[str, Any], statement_name:
         st.warning(f"No {statement_name.lower()} data available")
         return
     
-    # Convert to DataFrame for better display
-    df_data = []
-    for item in statement_data:
-        df_data.append({
-            "Metric": item.get("concept", "Unknown"),
-            "Value": item.get("value", 0),
-            "Unit": item.get("unit", ""),
-            "Label": item.get("label", "")
-        })
+    # Build the table column-wise straight from the line items
+    df = pd.DataFrame.from_records(statement_data, columns=["concept", "value", "unit", "label"])
     
-    if df_data:
-        df = pd.DataFrame(df_data)
-        
-        # Format the value column
-        def format_value(row):
-            value = row['Value']
-            if value is None or value == 0:
-                return "N/A"
-            
-            # Format based on unit
-            unit = row['Unit']
-            if unit == 'USD':
-                return format_currency(value)
-            elif unit in ['shares', 'USD/shares']:
-                return format_number(value)
-            else:
-                return f"{value:,.2f}"
+    if not df.empty:
+        df = df.fillna({"concept": "Unknown", "unit": "", "label": ""})
+        values = df["value"]
+        units = df["unit"]
         
-        df['Formatted Value'] = df.apply(format_value, axis=1)
+        # Format each unit class in one pass; missing and zero values stay N/A
+        formatted = pd.Series("N/A", index=df.index, dtype=object)
+        present = values.notna() & (values != 0)
+        currency = present & (units == "USD")
+        counts = present & units.isin(_COUNT_UNITS)
+        plain = present & ~currency & ~counts
+        formatted[currency] = values[currency].map(format_currency)
+        formatted[counts] = values[counts].map(format_number)
+        formatted[plain] = values[plain].map("{:,.2f}".format)
         
         # Display the table
-        display_df = df[['Metric', 'Formatted Value', 'Label']].copy()
+        display_df = pd.DataFrame({
+            "Metric": df["concept"],
+            "Formatted Value": formatted,
+            "Label": df["label"]
+        }, dtype="string[pyarrow]")
         st.dataframe(display_df, width='stretch', hide_index=True)
     else:
         st.info(f"No data available for {statement_name}")
@@ -64,42 +105,17 @@ def display_financials_summary(financials_data: Dict[str, Any]):
         if 'report' in latest_report:
             report_data = latest_report['report']
             
-            # Extract from income statement (ic)
-            if 'ic' in report_data:
-                for item in report_data['ic']:
-                    concept = item.get('concept', '').lower()
-                    value = item.get('value', 0)
-                    
-                    if 'revenue' in concept and 'contract' in concept:
-                        key_metrics['Revenue'] = value
-                    elif 'net income' in concept and 'loss' in concept:
-                        key_metrics['Net Income'] = value
-                    elif 'operating income' in concept and 'loss' in concept:
-                        key_metrics['Operating Income'] = value
-                    elif 'gross profit' in concept:
-                        key_metrics['Gross Profit'] = value
-            
-            # Extract from balance sheet (bs)
-            if 'bs' in report_data:
-                for item in report_data['bs']:
-                    concept = item.get('concept', '').lower()
-                    value = item.get('value', 0)
-                    
-                    if 'assets' in concept and 'total' in concept and 'current' not in concept:
-                        key_metrics['Total Assets'] = value
-                    elif 'liabilities' in concept and 'total' in concept and 'current' not in concept:
-                        key_metrics['Total Liabilities'] = value
-                    elif 'stockholders equity' in concept or 'shareholders equity' in concept:
-                        key_metrics['Shareholders Equity'] = value
-            
-            # Extract from cash flow (cf)
-            if 'cf' in report_data:
-                for item in report_data['cf']:
+            # One pass per statement; known XBRL concepts are a dict hit, anything else takes the
+            # first rule that matches its concept
+            for statement, rules in _SUMMARY_RULES:
+                concept_labels = _CONCEPT_LABELS[statement]
+                for item in report_data.get(statement, ()):
                     concept = item.get('concept', '').lower()
-                    value = item.get('value', 0)
-                    
-                    if 'operating activities' in concept and 'net cash' in concept:
-                        key_metrics['Operating Cash Flow'] = value
+                    label = concept_labels.get(concept.replace(':', '_').rpartition('_')[2])
+                    if label is None:
+                        label = next((label for label, pattern in rules if pattern.match(concept)), None)
+                    if label:
+                        key_metrics[label] = item.get('value', 0)
     
     if key_metrics:
         col1, col2, col3, col4 = st.columns(4)
@@ -126,16 +142,14 @@ def render_finnhub_financials_tab(ticker: str):
     col1, col2 = st.columns([3, 1])
     with col2:
         if st.button("🔄 Refresh Financials", key="refresh_finnhub_financials"):
-            from dashboard_utils import get_cached_finnhub_financials
             financials_data = get_cached_finnhub_financials(ticker, force_refresh=True)
             st.success("Finnhub financials refreshed!")
             st.rerun()
     
     # Fetch data for this tab
-    from dashboard_utils import get_cached_finnhub_financials
     financials_data = get_cached_finnhub_financials(ticker)
     
-    if financials_data and 'data' in financials_data and financials_data['data']:
+    if financials_data and financials_data.get('data'):
         # Display summary metrics
         display_financials_summary(financials_data)
         
@@ -173,7 +187,7 @@ def render_finnhub_financials_tab(ticker: str):
         
         # Raw data section
         with st.expander("🔍 Raw Financial Data"):
-            st.json(financials_data)
+            display_raw_json(financials_data, f"{ticker}_finnhub_financials.json")
             
     else:
         st.error("Could not retrieve Finnhub financials. Please check the ticker symbol and API key configuration.")
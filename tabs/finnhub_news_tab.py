@@ -1,8 +1,13 @@
 """Finnhub News Tab for Volur Dashboard."""
 
+import pandas as pd
 import streamlit as st
+from html import escape
 from typing import List, Dict, Any
-from datetime import datetime
+from dashboard_utils import display_raw_json, get_cached_finnhub_news, get_cache_info
+
+# Articles shown as open expanders; later ones are emitted as a single block of <details> elements
+_EXPANDED_ARTICLES = 3
 
 
 def display_finnhub_news(news_data: List[Dict[str, Any]], ticker: str):
@@ -15,47 +20,96 @@ def display_finnhub_news(news_data: List[Dict[str, Any]], ticker: str):
     
     st.info(f"Found {len(news_data)} news articles from the last 7 days")
     
-    for i, article in enumerate(news_data):
-        with st.expander(f"📄 {article.get('headline', 'No headline')[:80]}...", expanded=(i < 3)):
-            col1, col2 = st.columns([3, 1])
-            
-            with col1:
-                st.markdown(f"**{article.get('headline', 'No headline')}**")
-                st.write(article.get('summary', 'No summary available'))
-                
-                # Source and datetime
-                source = article.get('source', 'Unknown source')
-                datetime_str = article.get('datetime', 0)
-                if datetime_str:
-                    try:
-                        dt = datetime.fromtimestamp(datetime_str)
-                        formatted_time = dt.strftime('%Y-%m-%d %H:%M UTC')
-                    except:
-                        formatted_time = str(datetime_str)
-                else:
-                    formatted_time = 'Unknown time'
-                
-                st.caption(f"Source: {source} | Published: {formatted_time}")
-            
-            with col2:
-                # Related tickers
-                related = article.get('related', [])
-                if related:
-                    st.write("**Related:**")
-                    for ticker_symbol in related[:3]:  # Show max 3 related tickers
-                        st.write(f"• {ticker_symbol}")
-                
-                # Category
-                category = article.get('category', '')
-                if category:
-                    st.write(f"**Category:** {category}")
-            
-            # URL if available
-            url = article.get('url', '')
-            if url:
-                st.markdown(f"[Read full article →]({url})")
-            
-            st.divider()
+    published = _format_published_times(news_data)
+    for i, article in enumerate(news_data[:_EXPANDED_ARTICLES]):
+        headline = article.get('headline') or 'No headline'
+        with st.expander(f"📄 {headline[:80]}...", expanded=True):
+            st.markdown(_article_markdown(article, headline, published[i]))
+    
+    # The rest collapse natively in the browser as one HTML block rather than one expander each
+    if len(news_data) > _EXPANDED_ARTICLES:
+        st.markdown("\n".join(
+            _article_details_html(article, published[i])
+            for i, article in enumerate(news_data[_EXPANDED_ARTICLES:], start=_EXPANDED_ARTICLES)
+        ), unsafe_allow_html=True)
+
+
+def _format_published_times(news_data: List[Dict[str, Any]]) -> List[str]:
+    """Format every article's epoch-seconds timestamp in one vectorized pass."""
+    stamps = pd.to_numeric(pd.Series([article.get('datetime') for article in news_data], dtype=object), errors='coerce')
+    stamps = stamps.where(stamps > 0)
+    published = pd.to_datetime(stamps, unit='s', utc=True, errors='coerce').dt.strftime('%Y-%m-%d %H:%M UTC')
+    return published.fillna('Unknown time').tolist()
+
+
+def _related_symbols(article: Dict[str, Any]) -> List[str]:
+    """Return up to three related tickers for an article."""
+    related = article.get('related') or []
+    if isinstance(related, str):
+        # Finnhub sends related tickers as a comma-separated string
+        related = [symbol for symbol in related.split(',') if symbol]
+    return list(related[:3])  # Show max 3 related tickers
+
+
+def _article_markdown(article: Dict[str, Any], headline: str, formatted_time: str) -> str:
+    """Build the body of one news expander as a single Markdown string."""
+    # Source and datetime
+    source = article.get('source') or 'Unknown source'
+
+    parts = [
+        f"**{headline}**",
+        article.get('summary') or 'No summary available',
+        f":gray[Source: {source} | Published: {formatted_time}]",
+    ]
+
+    details = []
+    # Related tickers
+    related = _related_symbols(article)
+    if related:
+        details.append("**Related:** " + ", ".join(related))
+    # Category
+    category = article.get('category', '')
+    if category:
+        details.append(f"**Category:** {category}")
+    if details:
+        parts.append(" · ".join(details))
+
+    # URL if available
+    url = article.get('url') or ''
+    if url:
+        parts.append(f"[Read full article →]({url})")
+
+    return "\n\n".join(parts)
+
+
+def _article_details_html(article: Dict[str, Any], formatted_time: str) -> str:
+    """Build one collapsed article as an escaped HTML <details> element."""
+    # Finnhub sends null for missing fields, so fall back before escaping
+    raw_headline = str(article.get('headline') or 'No headline')
+    headline = escape(raw_headline)
+    source = escape(str(article.get('source') or 'Unknown source'))
+
+    parts = [
+        f"<p><strong>{headline}</strong></p>",
+        f"<p>{escape(str(article.get('summary') or 'No summary available'))}</p>",
+        f"<p><small>Source: {source} | Published: {formatted_time}</small></p>",
+    ]
+
+    details = []
+    related = _related_symbols(article)
+    if related:
+        details.append("<strong>Related:</strong> " + escape(", ".join(related)))
+    category = article.get('category')
+    if category:
+        details.append(f"<strong>Category:</strong> {escape(str(category))}")
+    if details:
+        parts.append(f"<p>{' · '.join(details)}</p>")
+
+    url = str(article.get('url') or '')
+    if url.startswith(('http://', 'https://')):
+        parts.append(f'<p><a href="{escape(url)}" target="_blank">Read full article →</a></p>')
+
+    return f"<details><summary>📄 {escape(raw_headline[:80])}...</summary>{''.join(parts)}</details>"
 
 
 def render_finnhub_news_tab(ticker: str):
@@ -66,17 +120,14 @@ def render_finnhub_news_tab(ticker: str):
     col1, col2 = st.columns([3, 1])
     with col2:
         if st.button("🔄 Refresh News", key="refresh_finnhub_news"):
-            from dashboard_utils import get_cached_finnhub_news
             finnhub_news = get_cached_finnhub_news(ticker, force_refresh=True)
             st.success("Finnhub news refreshed!")
             st.rerun()
     
     # Fetch data for this tab
-    from dashboard_utils import get_cached_finnhub_news
     finnhub_news = get_cached_finnhub_news(ticker)
     
     # Display cache status
-    from dashboard_utils import get_cache_info
     cache_info = get_cache_info("finnhub", ticker, "news")
     if cache_info:
         st.success(f"📅 Data cached at: {cache_info['cached_at'].strftime('%Y-%m-%d %H:%M:%S')} (Expires: {cache_info['expires_at'].strftime('%Y-%m-%d %H:%M:%S')})")
@@ -88,6 +139,6 @@ def render_finnhub_news_tab(ticker: str):
         
         # Raw news data
         with st.expander("🔍 Raw News Data"):
-            st.json(finnhub_news)
+            display_raw_json(finnhub_news, f"{ticker}_finnhub_news.json")
     else:
         st.error("Could not retrieve Finnhub news. Please check the ticker symbol and API key configuration.")
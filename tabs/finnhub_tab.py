@@ -2,73 +2,76 @@
 
 import streamlit as st
 from typing import Dict, Any, Optional
-from dashboard_utils import format_currency, format_number, format_percentage
+from dashboard_utils import (
+    format_currency, format_number, format_percentage, display_raw_json, get_cached_finnhub_data, get_cache_info
+)
 
 
 def display_finnhub_data(data: Dict[str, Any]):
     """Display comprehensive Finnhub data with logo."""
     st.subheader("📊 Finnhub Market Data")
+    get = data.get
     
     # Company Logo and Basic Info
     col1, col2, col3 = st.columns([1, 2, 2])
     with col1:
-        if data.get('logo'):
-            st.image(data['logo'], width=100, caption=data.get('longName', 'Company Logo'))
+        if get('logo'):
+            st.image(data['logo'], width=100, caption=get('longName', 'Company Logo'))
         else:
             st.write("📊")
     with col2:
-        st.metric("Company", data.get('longName', 'N/A'))
-        st.metric("Ticker", data.get('ticker', 'N/A'))
+        st.metric("Company", get('longName', 'N/A'))
+        st.metric("Ticker", get('ticker', 'N/A'))
     with col3:
-        st.metric("Exchange", data.get('exchange', 'N/A'))
-        st.metric("Country", data.get('country', 'N/A'))
+        st.metric("Exchange", get('exchange', 'N/A'))
+        st.metric("Country", get('country', 'N/A'))
     
     # Price Data
     st.subheader("💰 Price Information")
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Current Price", format_currency(data.get('regularMarketPrice')))
+        st.metric("Current Price", format_currency(get('regularMarketPrice')))
     with col2:
-        st.metric("Previous Close", format_currency(data.get('regularMarketPreviousClose')))
+        st.metric("Previous Close", format_currency(get('regularMarketPreviousClose')))
     with col3:
-        st.metric("Day High", format_currency(data.get('regularMarketDayHigh')))
+        st.metric("Day High", format_currency(get('regularMarketDayHigh')))
     with col4:
-        st.metric("Day Low", format_currency(data.get('regularMarketDayLow')))
+        st.metric("Day Low", format_currency(get('regularMarketDayLow')))
     
     # Additional Price Metrics
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Open", format_currency(data.get('open')))
+        st.metric("Open", format_currency(get('open')))
     with col2:
-        st.metric("Change", format_currency(data.get('change')))
+        st.metric("Change", format_currency(get('change')))
     with col3:
-        st.metric("Change %", format_percentage(data.get('change_percent')))
+        st.metric("Change %", format_percentage(get('change_percent')))
     with col4:
-        st.metric("Volume", format_number(data.get('regularMarketVolume')))
+        st.metric("Volume", format_number(get('regularMarketVolume')))
     
     # Market Data
     st.subheader("📈 Market Information")
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Market Cap", format_currency(data.get('marketCap')))
+        st.metric("Market Cap", format_currency(get('marketCap')))
     with col2:
-        st.metric("Shares Outstanding", format_number(data.get('sharesOutstanding')))
+        st.metric("Shares Outstanding", format_number(get('sharesOutstanding')))
     with col3:
-        st.metric("Currency", data.get('currency', 'N/A'))
+        st.metric("Currency", get('currency', 'N/A'))
     with col4:
-        st.metric("IPO Date", data.get('ipo', 'N/A'))
+        st.metric("IPO Date", get('ipo', 'N/A'))
     
     # Company Details
     st.subheader("🏢 Company Details")
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Sector", data.get('sector', 'N/A'))
+        st.metric("Sector", get('sector', 'N/A'))
     with col2:
-        st.metric("Industry", data.get('industry', 'N/A'))
+        st.metric("Industry", get('industry', 'N/A'))
     with col3:
-        st.metric("Phone", data.get('phone', 'N/A'))
+        st.metric("Phone", get('phone', 'N/A'))
     with col4:
-        if data.get('weburl'):
+        if get('weburl'):
             st.markdown(f"[Website]({data['weburl']})")
         else:
             st.metric("Website", "N/A")
@@ -82,17 +85,14 @@ def render_finnhub_tab(ticker: str):
     col1, col2 = st.columns([3, 1])
     with col2:
         if st.button("🔄 Refresh Finnhub", key="refresh_finnhub"):
-            from dashboard_utils import get_cached_finnhub_data
             finnhub_data = get_cached_finnhub_data(ticker, force_refresh=True)
             st.success("Finnhub data refreshed!")
             st.rerun()
     
     # Fetch data for this tab
-    from dashboard_utils import get_cached_finnhub_data
     finnhub_data = get_cached_finnhub_data(ticker)
     
     # Display cache status
-    from dashboard_utils import get_cache_info
     cache_info = get_cache_info("finnhub", ticker, "quote_data")
     if cache_info:
         st.success(f"📅 Data cached at: {cache_info['cached_at'].strftime('%Y-%m-%d %H:%M:%S')} (Expires: {cache_info['expires_at'].strftime('%Y-%m-%d %H:%M:%S')})")
@@ -104,6 +104,6 @@ def render_finnhub_tab(ticker: str):
         
         # Raw data
         with st.expander("🔍 Raw Finnhub Data"):
-            st.json(finnhub_data)
+            display_raw_json(finnhub_data, f"{ticker}_finnhub.json")
     else:
         st.error("Could not retrieve Finnhub data. Please check the ticker symbol and API key configuration.")
@@ -1,60 +1,97 @@
 """Securities Listing Tab for Volur Dashboard."""
 
+import hashlib
+import orjson
 import streamlit as st
 import pandas as pd
-from typing import Dict, Any, List, Optional
-from dashboard_utils import get_cache_info
+from functools import partial
+from typing import Dict, Any, List, Optional, Tuple
+from dashboard_utils import display_raw_json, get_cache_info
 
 
-def filter_securities_data(securities_data: List[Dict[str, Any]], 
+def filter_securities_data(df: pd.DataFrame,
                           search_term: str = "",
                           exchange_filter: str = "All",
                           asset_type_filter: str = "All",
-                          status_filter: str = "All") -> List[Dict[str, Any]]:
+                          status_filter: str = "All") -> pd.DataFrame:
     """Filter securities data based on search criteria."""
-    filtered_data = securities_data.copy()
+    mask = pd.Series(True, index=df.index)
     
     # Text search across symbol and name
     if search_term:
-        search_lower = search_term.lower()
-        filtered_data = [
-            sec for sec in filtered_data
-            if (search_lower in sec.get('symbol', '').lower() or 
-                search_lower in sec.get('name', '').lower())
-        ]
-    
-    # Exchange filter
-    if exchange_filter != "All":
-        filtered_data = [
-            sec for sec in filtered_data
-            if sec.get('exchange') == exchange_filter
-        ]
-    
-    # Asset type filter
-    if asset_type_filter != "All":
-        filtered_data = [
-            sec for sec in filtered_data
-            if sec.get('assetType') == asset_type_filter
-        ]
-    
-    # Status filter
-    if status_filter != "All":
-        filtered_data = [
-            sec for sec in filtered_data
-            if sec.get('status') == status_filter
-        ]
-    
-    return filtered_data
-
-
-def display_securities_table(securities_data: List[Dict[str, Any]]):
-    """Display securities data in a searchable table."""
+        matches = pd.Series(False, index=df.index)
+        for column in ('symbol', 'name'):
+            if column in df.columns:
+                matches |= df[column].str.contains(search_term, case=False, regex=False, na=False)
+        mask &= matches
+    
+    # Exchange, asset type and status filters
+    for column, value in (('exchange', exchange_filter), ('assetType', asset_type_filter), ('status', status_filter)):
+        if value != "All":
+            mask &= (df[column] == value) if column in df.columns else False
+    
+    return df[mask]
+
+
+# Column labels for the listing table
+_LISTING_COLUMN_CONFIG = {
+    'symbol': "Symbol",
+    'name': "Name",
+    'exchange': "Exchange",
+    'assetType': "Asset Type",
+    'ipoDate': "IPO Date",
+    'delistingDate': "Delisting Date",
+    'status': "Status",
+}
+
+
+def _select_listing_row():
+    """Send the selected row's symbol to the main ticker input on the rerun that follows."""
+    rows = st.session_state.securities_table.selection.rows
+    symbols = st.session_state.get('_securities_page_symbols', [])
+    if rows and rows[0] < len(symbols):
+        st.session_state.selected_ticker_from_listing = symbols[rows[0]]
+        # The table lives in a fragment; ask it to rerun the whole app so the ticker input sees the pick
+        st.session_state._securities_selection_pending = True
+
+
+# Low-cardinality columns stored as categoricals; their categories double as the filter options
+_CATEGORY_COLUMNS = ('exchange', 'assetType', 'status')
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _listing_frame(version: Any, _securities_data: List[Dict[str, Any]]) -> Tuple[pd.DataFrame, Dict[str, List[str]], int]:
+    """Build the listing DataFrame, its filter options and its active count once per listing version."""
+    df = pd.DataFrame(_securities_data)
+    options = {}
+    for column in _CATEGORY_COLUMNS:
+        if column in df.columns:
+            # A handful of distinct values across thousands of rows: compare and count on int codes
+            df[column] = df[column].astype('category')
+            options[column] = sorted(df[column].cat.categories.tolist())
+        else:
+            options[column] = []
+    active_count = int((df['status'] == 'Active').sum()) if 'status' in df.columns else 0
+    return df, options, active_count
+
+
+@st.fragment
+def display_securities_table(securities_data: List[Dict[str, Any]], version: Any):
+    """Display securities data in a searchable table.
+    
+    version identifies the listing (e.g. its count and cache time); the DataFrame and filter
+    options are rebuilt only when it changes. Runs as a fragment, so searching, filtering and
+    paging rerun only the table rather than every tab's data fetches.
+    """
+    if st.session_state.pop('_securities_selection_pending', False):
+        st.rerun(scope="app")
+    
     if not securities_data:
         st.warning("No securities data available")
         return
     
     # Create DataFrame
-    df = pd.DataFrame(securities_data)
+    df, options, active_count = _listing_frame(version, securities_data)
     
     # Ensure we have the expected columns
     expected_columns = ['symbol', 'name', 'exchange', 'assetType', 'ipoDate', 'delistingDate', 'status']
@@ -71,16 +108,13 @@ def display_securities_table(securities_data: List[Dict[str, Any]]):
         st.metric("Total Securities", f"{len(df):,}")
     
     with col2:
-        active_count = len(df[df.get('status', '') == 'Active']) if 'status' in df.columns else 0
         st.metric("Active", f"{active_count:,}")
     
     with col3:
-        unique_exchanges = df['exchange'].nunique() if 'exchange' in df.columns else 0
-        st.metric("Exchanges", unique_exchanges)
+        st.metric("Exchanges", len(options['exchange']))
     
     with col4:
-        unique_asset_types = df['assetType'].nunique() if 'assetType' in df.columns else 0
-        st.metric("Asset Types", unique_asset_types)
+        st.metric("Asset Types", len(options['assetType']))
     
     # Compact search and filter controls
     col1, col2, col3, col4 = st.columns(4)
@@ -93,20 +127,17 @@ def display_securities_table(securities_data: List[Dict[str, Any]]):
         )
     
     with col2:
-        exchange_options = ["All"] + sorted(df['exchange'].unique().tolist()) if 'exchange' in df.columns else ["All"]
-        exchange_filter = st.selectbox("Exchange", exchange_options, key="exchange_filter")
+        exchange_filter = st.selectbox("Exchange", ["All"] + options['exchange'], key="exchange_filter")
     
     with col3:
-        asset_type_options = ["All"] + sorted(df['assetType'].unique().tolist()) if 'assetType' in df.columns else ["All"]
-        asset_type_filter = st.selectbox("Asset Type", asset_type_options, key="asset_type_filter")
+        asset_type_filter = st.selectbox("Asset Type", ["All"] + options['assetType'], key="asset_type_filter")
     
     with col4:
-        status_options = ["All"] + sorted(df['status'].unique().tolist()) if 'status' in df.columns else ["All"]
-        status_filter = st.selectbox("Status", status_options, key="status_filter")
+        status_filter = st.selectbox("Status", ["All"] + options['status'], key="status_filter")
     
     # Apply filters
-    filtered_data = filter_securities_data(
-        securities_data,
+    filtered_df = filter_securities_data(
+        df,
         search_term=search_term,
         exchange_filter=exchange_filter,
         asset_type_filter=asset_type_filter,
@@ -114,14 +145,12 @@ def display_securities_table(securities_data: List[Dict[str, Any]]):
     )
     
     # Display filtered results
-    if filtered_data:
-        filtered_df = pd.DataFrame(filtered_data)
-        
-        st.caption(f"📋 **{len(filtered_data)} results**")
+    if not filtered_df.empty:
+        st.caption(f"📋 **{len(filtered_df)} results**")
         
         # Paginated display with action buttons
         items_per_page = 50
-        total_pages = (len(filtered_data) + items_per_page - 1) // items_per_page
+        total_pages = (len(filtered_df) + items_per_page - 1) // items_per_page
         
         # Page selector
         if total_pages > 1:
@@ -132,69 +161,48 @@ def display_securities_table(securities_data: List[Dict[str, Any]]):
         
         # Get data for current page
         start_idx = page * items_per_page
-        end_idx = min(start_idx + items_per_page, len(filtered_data))
-        page_data = filtered_data[start_idx:end_idx]
+        end_idx = min(start_idx + items_per_page, len(filtered_df))
         
-        st.markdown(f"**Page {page + 1} of {total_pages} | Showing {start_idx + 1}-{end_idx} of {len(filtered_data)} results**")
-        st.markdown("**Click '📊 Analyze' button for any ticker to load all data sources:**")
+        st.markdown(f"**Page {page + 1} of {total_pages} | Showing {start_idx + 1}-{end_idx} of {len(filtered_df)} results**")
+        st.markdown("**Select a row to load all data sources for its ticker:**")
         
-        # Create a custom display with buttons for current page
-        for i, row in enumerate(page_data):
-            col1, col2, col3, col4, col5, col6, col7 = st.columns([1, 3, 1, 1, 1, 1, 1])
-            
-            with col1:
-                if st.button(f"📊", key=f"analyze_{row.get('symbol', '')}_{start_idx + i}", help=f"Analyze {row.get('symbol', '')} - {row.get('name', '')}"):
-                    # Set the ticker in session state for event-driven architecture
-                    selected_symbol = row.get('symbol', '')
-                    st.session_state.selected_ticker_from_listing = selected_symbol
-                    st.success(f"✅ Selected **{selected_symbol}** for analysis! Event fired to update all tabs.")
-                    # Force a rerun to process the event
-                    st.rerun()
-            
-            with col2:
-                symbol = row.get('symbol', '')
-                name = row.get('name', '')
-                st.write(f"**{symbol}** - {name}")
-            
-            with col3:
-                st.write(row.get('exchange', ''))
-            
-            with col4:
-                st.write(row.get('assetType', ''))
-            
-            with col5:
-                st.write(row.get('ipoDate', ''))
-            
-            with col6:
-                st.write(row.get('delistingDate', ''))
-            
-            with col7:
-                st.write(row.get('status', ''))
+        # One table per page; selecting a row hands its symbol to the main ticker input
+        page_df = filtered_df.iloc[start_idx:end_idx][available_columns]
+        st.session_state._securities_page_symbols = page_df['symbol'].tolist() if 'symbol' in page_df.columns else []
+        st.dataframe(
+            page_df,
+            width='stretch',
+            hide_index=True,
+            column_config=_LISTING_COLUMN_CONFIG,
+            key="securities_table",
+            on_select=_select_listing_row,
+            selection_mode="single-row",
+        )
         
-        # Download button for filtered data
-        csv_data = filtered_df.to_csv(index=False)
+        # Download button for filtered data; the CSV is only built when the button is clicked
+        csv_data = partial(_filtered_csv, version, (search_term, exchange_filter, asset_type_filter, status_filter), filtered_df)
         st.download_button(
             label="📥 Download Filtered Data (CSV)",
             data=csv_data,
-            file_name=f"securities_list_{len(filtered_data)}_results.csv",
+            file_name=f"securities_list_{len(filtered_df)}_results.csv",
             mime="text/csv"
         )
         
         # Compact distribution info
-        if len(filtered_data) > 0:
+        if len(filtered_df) > 0:
             with st.expander("📈 Distribution"):
                 col1, col2 = st.columns(2)
                 
                 with col1:
                     if 'exchange' in filtered_df.columns:
-                        exchange_counts = filtered_df['exchange'].value_counts().head(10)
+                        exchange_counts = filtered_df['exchange'].value_counts().loc[lambda counts: counts > 0].head(10)
                         st.markdown("**Top Exchanges:**")
                         for exchange, count in exchange_counts.items():
                             st.write(f"- {exchange}: {count}")
                 
                 with col2:
                     if 'assetType' in filtered_df.columns:
-                        asset_type_counts = filtered_df['assetType'].value_counts().head(10)
+                        asset_type_counts = filtered_df['assetType'].value_counts().loc[lambda counts: counts > 0].head(10)
                         st.markdown("**Asset Types:**")
                         for asset_type, count in asset_type_counts.items():
                             st.write(f"- {asset_type}: {count}")
@@ -202,6 +210,30 @@ def display_securities_table(securities_data: List[Dict[str, Any]]):
         st.info("No securities match your search criteria")
 
 
+@st.cache_data(show_spinner=False)
+def _listing_csv(version: Any, _securities_data: List[Dict[str, Any]]) -> str:
+    """Serialize the full listing to CSV once per cached listing version."""
+    return pd.DataFrame(_securities_data).to_csv(index=False)
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _filtered_csv(version: Any, filters: Tuple[str, str, str, str], _filtered_df: pd.DataFrame) -> bytes:
+    """Serialize a filtered listing to CSV once per listing version and filter combination."""
+    return _filtered_df.to_csv(index=False).encode()
+
+
+def _listing_version(securities_data: List[Dict[str, Any]], total_count: int,
+                     cache_info: Optional[Dict[str, Any]]) -> Tuple[Any, ...]:
+    """Key the cached listing frame and CSVs to this copy of the listing.
+
+    The cache time identifies it cheaply; without a cache entry (e.g. MongoDB is down) fall back
+    to a hash of the rows, so a refreshed listing with the same count is not served stale.
+    """
+    if cache_info and cache_info.get('cached_at'):
+        return (total_count, cache_info['cached_at'])
+    return (total_count, hashlib.md5(orjson.dumps(securities_data)).hexdigest())
+
+
 def render_securities_listing_tab(listing_data: Optional[Dict[str, Any]]):
     """Render the Securities Listing tab."""
     st.markdown("### 📋 US Securities Listing")
@@ -227,24 +259,24 @@ def render_securities_listing_tab(listing_data: Optional[Dict[str, Any]]):
         st.caption(f"**Data Source:** Alpha Vantage LISTING_STATUS API | **Total Securities:** {total_count:,}")
         
         # Compact tip
-        st.caption("💡 **Tip:** Select a ticker below and click '📊 Analyze Ticker' to set it in the main input.")
+        st.caption("💡 **Tip:** Select a row in the table below to set its ticker in the main input.")
         
-        display_securities_table(securities_data)
+        version = _listing_version(securities_data, total_count, cache_info)
+        display_securities_table(securities_data, version)
         
         # Compact raw data section
         with st.expander("🔍 Raw Data"):
-            st.json(listing_data.get('securities', [])[:5])  # Show first 5 entries
+            display_raw_json(securities_data[:5], "securities_listing_sample.json")  # Show first 5 entries
             if len(securities_data) > 5:
                 st.caption(f"Showing first 5 of {len(securities_data)} securities.")
         
         # Download full dataset
-        if 'raw_csv' in listing_data:
-            st.download_button(
-                label="📥 Download Full Dataset (CSV)",
-                data=listing_data['raw_csv'],
-                file_name="us_securities_listing.csv",
-                mime="text/csv"
-            )
+        st.download_button(
+            label="📥 Download Full Dataset (CSV)",
+            data=partial(_listing_csv, version, securities_data),
+            file_name="us_securities_listing.csv",
+            mime="text/csv"
+        )
     
     else:
         st.error("Could not retrieve securities listing data. Please check the API key configuration.")
@@ -0,0 +1,94 @@
+"""Tests for the disk caching decorator."""
+
+import importlib
+from unittest.mock import Mock
+
+import pytest
+
+from volur import caching
+from volur.config import settings
+from volur.plugins.base import Quote
+
+
+@pytest.fixture
+def disk_cache(tmp_path, monkeypatch):
+    """Point the cached decorator at a throwaway cache directory."""
+    test_cache = caching.Cache(str(tmp_path))
+    monkeypatch.setattr(caching, "cache", test_cache)
+    return test_cache
+
+
+@pytest.fixture
+def make_finnhub_source(disk_cache, monkeypatch):
+    """Return a factory for FinnhubSource instances whose HTTP session is a mock."""
+    monkeypatch.setattr(settings, "finnhub_api_key", "test-key")
+    module = importlib.import_module("volur.plugins.finnhub_source")
+
+    def make():
+        source = module.FinnhubSource()
+        source.session = Mock()
+        return source
+    return make
+
+
+@pytest.fixture
+def finnhub_source(make_finnhub_source):
+    """Build a FinnhubSource whose HTTP session is a mock."""
+    return make_finnhub_source()
+
+
+def _response(content: bytes) -> Mock:
+    """Build a mock HTTP response with the given JSON body."""
+    response = Mock(status_code=200, content=content)
+    response.raise_for_status.return_value = None
+    return response
+
+
+class TestCachedDecorator:
+    """Test the cached decorator."""
+
+    def test_second_call_returns_cached_result(self, disk_cache):
+        """Test that a repeat call with the same arguments skips the function."""
+        calls = []
+
+        @caching.cached(ttl=60)
+        def double(value: int) -> int:
+            calls.append(value)
+            return value * 2
+
+        assert double(21) == 42
+        assert double(21) == 42
+        assert double(5) == 10
+        assert calls == [21, 5]
+
+    def test_finnhub_quote_cached_within_ttl(self, finnhub_source):
+        """Test that a second quote lookup within the TTL does not hit the HTTP session."""
+        finnhub_source.session.get.side_effect = [
+            _response(b'{"c": 150.0}'),
+            _response(b'{"currency": "USD", "shareOutstanding": 1000}'),
+        ]
+
+        first = finnhub_source.get_quote("AAPL")
+        calls_after_first = finnhub_source.session.get.call_count
+        second = finnhub_source.get_quote("AAPL")
+
+        assert calls_after_first == 2
+        assert finnhub_source.session.get.call_count == calls_after_first
+        assert isinstance(first, Quote)
+        assert second == first
+
+    def test_finnhub_quote_cached_across_instances(self, make_finnhub_source):
+        """Test that a new source instance, as in a later CLI run, reuses the cached quote."""
+        first_source = make_finnhub_source()
+        first_source.session.get.side_effect = [
+            _response(b'{"c": 150.0}'),
+            _response(b'{"currency": "USD", "shareOutstanding": 1000}'),
+        ]
+        first = first_source.get_quote("AAPL")
+
+        second_source = make_finnhub_source()
+        second = second_source.get_quote("AAPL")
+
+        second_source.session.get.assert_not_called()
+        assert second == first
+
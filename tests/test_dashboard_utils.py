@@ -0,0 +1,129 @@
+"""Tests for shared dashboard helpers."""
+
+import threading
+import time
+from concurrent.futures import wait
+from decimal import Decimal
+
+import pytest
+
+import dashboard_utils
+from dashboard_utils import _parse_av_fields, format_currency, format_number, format_percentage, format_ratio
+
+
+class UnhashableNumber(float):
+    """A float subclass that cannot be used as a cache key."""
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+class TestFormatters:
+    """Test the number formatting helpers."""
+
+    def test_formats_plain_numbers(self):
+        """Test the formatted output for ints, floats and None."""
+        assert format_currency(1234.5) == "$1,234.50"
+        assert format_percentage(12.345) == "12.35%"
+        assert format_ratio(1.5) == "1.50"
+        assert format_ratio(0) == "N/A"
+        assert format_number(2.5e9) == "2.50B"
+        assert format_number(999) == "999.00"
+        assert format_currency(None) == "N/A"
+
+    @pytest.mark.parametrize("formatter", [format_currency, format_percentage, format_ratio, format_number])
+    def test_unhashable_values_are_formatted(self, formatter):
+        """Test that values unusable as cache keys are formatted instead of raising."""
+        assert formatter(UnhashableNumber(2.0)) == formatter(2.0)
+
+    def test_other_numeric_types_bypass_cache(self):
+        """Test that Decimal and bool values format like the uncached helpers did."""
+        assert format_currency(Decimal("3.5")) == "$3.50"
+        assert format_ratio(False) == "N/A"
+        assert format_ratio(True) == "1.00"
+
+
+class TestParseAlphaVantageFields:
+    """Test parsing of Alpha Vantage Global Quote fields."""
+
+    def test_parses_global_quote(self):
+        """Test that every numeric field is converted to its type."""
+        fields = _parse_av_fields({
+            "02. open": "187.1500",
+            "03. high": "188.4400",
+            "04. low": "183.8900",
+            "05. price": "185.6400",
+            "06. volume": "82488674",
+            "08. previous close": "186.1900",
+            "09. change": "-0.5500",
+            "10. change percent": "-0.2954%",
+        })
+
+        assert fields == {
+            "regularMarketPrice": 185.64,
+            "regularMarketPreviousClose": 186.19,
+            "regularMarketDayHigh": 188.44,
+            "regularMarketDayLow": 183.89,
+            "regularMarketVolume": 82488674,
+            "open": 187.15,
+            "change": -0.55,
+            "change_percent": -0.2954,
+        }
+        assert isinstance(fields["regularMarketVolume"], int)
+
+    def test_missing_and_malformed_fields_default_to_zero(self):
+        """Test that absent, empty or unparseable values become 0 without raising."""
+        fields = _parse_av_fields({"05. price": "n/a", "06. volume": "", "10. change percent": "%"})
+
+        assert fields["regularMarketPrice"] == 0.0
+        assert fields["regularMarketVolume"] == 0
+        assert fields["change_percent"] == 0.0
+        assert fields["open"] == 0.0
+
+
+class SlowMissingCache:
+    """Cache stub that is slow to answer and never has anything stored."""
+
+    def get_many(self, keys):
+        time.sleep(0.05)
+        return {}
+
+    def set_many(self, items):
+        return True
+
+
+class TestFinnhubBundle:
+    """Test fetching the Finnhub bundle on the shared worker pool."""
+
+    def test_more_bundles_than_workers_all_finish(self, monkeypatch):
+        """Test that bundles running on a pool do not starve waiting for their own fetches."""
+        monkeypatch.setattr(dashboard_utils, "get_cache", SlowMissingCache)
+        monkeypatch.setattr(dashboard_utils, "_fetch_fresh", lambda fetch, ticker: {"ticker": ticker})
+
+        pool = dashboard_utils._PREFETCH_POOL
+        tickers = [f"T{i}" for i in range(pool._max_workers + 4)]
+        futures = [pool.submit(dashboard_utils.get_cached_finnhub_bundle, t) for t in tickers]
+        done, pending = wait(futures, timeout=10)
+
+        assert not pending
+        assert [future.result()["news"] for future in futures] == [{"ticker": t} for t in tickers]
+
+    def test_prefetch_skips_ticker_already_in_flight(self, monkeypatch):
+        """Test that a ticker already being prefetched is not queued again."""
+        release = threading.Event()
+        calls = []
+
+        def fetch(ticker):
+            calls.append((ticker, threading.current_thread().name.startswith("volur-prefetch")))
+            release.wait(5)
+
+        monkeypatch.setattr(dashboard_utils, "_PREFETCHERS", (fetch,))
+        dashboard_utils.prefetch_ticker("AAPL")
+        dashboard_utils.prefetch_ticker("AAPL")
+        release.set()
+        deadline = time.monotonic() + 5
+        while dashboard_utils._PREFETCHING and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        # Run once, and on the prefetch pool rather than the render pool
+        assert calls == [("AAPL", True)]
+        assert not dashboard_utils._PREFETCHING
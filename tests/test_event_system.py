@@ -0,0 +1,60 @@
+"""Tests for the dashboard event bus."""
+
+from event_system import Event, EventBus
+
+
+class TestEventBus:
+    """Test subscription handling on EventBus."""
+
+    def test_duplicate_subscription_called_once(self):
+        """Test that subscribing the same callback twice delivers each event once."""
+        bus = EventBus()
+        received = []
+        bus.subscribe("ticker_changed", received.append)
+        bus.subscribe("ticker_changed", received.append)
+
+        bus.publish(Event("ticker_changed", {"ticker": "AAPL"}))
+
+        assert len(received) == 1
+
+    def test_unsubscribe_stops_delivery(self):
+        """Test that an unsubscribed callback receives no further events."""
+        bus = EventBus()
+        kept, dropped = [], []
+        bus.subscribe("ticker_changed", kept.append)
+        bus.subscribe("ticker_changed", dropped.append)
+
+        bus.unsubscribe("ticker_changed", dropped.append)
+        bus.publish(Event("ticker_changed", {"ticker": "AAPL"}))
+
+        assert len(kept) == 1
+        assert dropped == []
+
+    def test_unsubscribe_unknown_callback_is_ignored(self):
+        """Test that unsubscribing a callback that never subscribed does not raise."""
+        EventBus().unsubscribe("ticker_changed", print)
+
+    def test_callback_may_unsubscribe_itself(self):
+        """Test that a callback removing itself during publish does not break delivery."""
+        bus = EventBus()
+        received = []
+
+        def once(event):
+            received.append(event)
+            bus.unsubscribe("ticker_changed", once)
+
+        bus.subscribe("ticker_changed", once)
+        bus.subscribe("ticker_changed", received.append)
+        bus.publish(Event("ticker_changed", {}))
+        bus.publish(Event("ticker_changed", {}))
+
+        assert len(received) == 3
+
+    def test_history_by_type(self):
+        """Test that history can be read overall and per event type."""
+        bus = EventBus()
+        bus.publish(Event("a", {}))
+        bus.publish(Event("b", {}))
+
+        assert [event.event_type for event in bus.get_event_history()] == ["a", "b"]
+        assert [event.event_type for event in bus.get_event_history("b")] == ["b"]
@@ -0,0 +1,79 @@
+"""Tests for Finnhub news formatting."""
+
+from tabs.finnhub_news_tab import _article_details_html, _article_markdown, _format_published_times, _related_symbols
+
+
+class TestPublishedTimes:
+    """Test vectorized article timestamp formatting."""
+
+    def test_formats_epoch_seconds_as_utc(self):
+        """Test that epoch seconds format as UTC minutes."""
+        assert _format_published_times([{"datetime": 1700000000}]) == ["2023-11-14 22:13 UTC"]
+
+    def test_missing_and_invalid_values(self):
+        """Test that missing, zero, negative and non-numeric values are unknown."""
+        articles = [{}, {"datetime": 0}, {"datetime": -5}, {"datetime": "soon"}, {"datetime": None}]
+        assert _format_published_times(articles) == ["Unknown time"] * 5
+
+    def test_numeric_strings_and_order(self):
+        """Test that numeric strings parse and results keep article order."""
+        articles = [{"datetime": "1700000000"}, {}, {"datetime": 1600000000}]
+        assert _format_published_times(articles) == [
+            "2023-11-14 22:13 UTC", "Unknown time", "2020-09-13 12:26 UTC"
+        ]
+
+    def test_empty(self):
+        """Test that no articles give no timestamps."""
+        assert _format_published_times([]) == []
+
+
+class TestArticleDetailsHtml:
+    """Test the collapsed-article HTML builder."""
+
+    def test_escapes_script_tags(self):
+        """Test that markup in article fields is escaped rather than emitted."""
+        html = _article_details_html({
+            "headline": "<script>alert(1)</script>",
+            "summary": "<img src=x onerror=alert(1)>",
+            "source": "<b>Wire</b>",
+            "category": "<i>x</i>",
+            "related": "<A>,B",
+        }, "Unknown time")
+
+        assert "<script>" not in html
+        assert "<img" not in html
+        assert "<b>Wire" not in html
+        assert "&lt;script&gt;alert(1)&lt;/script&gt;" in html
+        assert "&lt;img src=x onerror=alert(1)&gt;" in html
+        assert "&lt;A&gt;, B" in html
+
+    def test_drops_non_http_links(self):
+        """Test that javascript: and other non-http(s) URLs are not linked."""
+        for url in ("javascript:alert(1)", " javascript:alert(1)", "JAVASCRIPT:alert(1)", "data:text/html,x", "//evil"):
+            html = _article_details_html({"headline": "H", "url": url}, "Unknown time")
+            assert "<a " not in html
+            assert "javascript" not in html.lower()
+
+    def test_escapes_http_link_attribute(self):
+        """Test that an http(s) URL is linked with its quotes escaped."""
+        html = _article_details_html({"headline": "H", "url": 'https://x.test/?a=1&b="><script>'}, "Unknown time")
+        assert '<a href="https://x.test/?a=1&amp;b=&quot;&gt;&lt;script&gt;" target="_blank">' in html
+
+    def test_null_fields_fall_back(self):
+        """Test that null fields from Finnhub render defaults instead of raising."""
+        article = {"headline": None, "summary": None, "source": None, "url": None, "category": None, "related": None}
+        html = _article_details_html(article, "Unknown time")
+
+        assert "<summary>📄 No headline...</summary>" in html
+        assert "No summary available" in html
+        assert "Source: Unknown source" in html
+        assert "<a " not in html
+        assert _article_markdown(article, "No headline", "Unknown time") == (
+            "**No headline**\n\nNo summary available\n\n:gray[Source: Unknown source | Published: Unknown time]"
+        )
+
+    def test_related_symbols_split_and_limited(self):
+        """Test that Finnhub's comma-separated related tickers are split and capped at three."""
+        assert _related_symbols({"related": "AAPL,MSFT,,GOOG,AMZN"}) == ["AAPL", "MSFT", "GOOG"]
+        assert _related_symbols({"related": ["A", "B"]}) == ["A", "B"]
+        assert _related_symbols({}) == []
@@ -0,0 +1,201 @@
+"""Tests for the MongoDB cache."""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from volur import mongodb_cache
+from volur.mongodb_cache import MongoDBCache
+
+
+class FakeClock:
+    """Monotonic clock the tests advance by hand."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the memory layer's monotonic clock."""
+    fake = FakeClock()
+    monkeypatch.setattr(mongodb_cache, "time", SimpleNamespace(monotonic=fake))
+    return fake
+
+
+@pytest.fixture
+def cache():
+    """Build a cache whose MongoDB collection is a mock."""
+    instance = MongoDBCache(memory_ttl_seconds=60, memory_maxsize=3)
+    instance._collection = Mock()
+    return instance
+
+
+def _doc(cache, source, ticker, endpoint, expires_in=timedelta(hours=1)):
+    """Build a stored document as MongoDB would return it."""
+    cached_at = datetime.utcnow()
+    return {
+        "cache_key": cache._generate_cache_key(source, ticker, endpoint),
+        "source": source,
+        "ticker": ticker,
+        "endpoint": endpoint,
+        "data": {"ticker": ticker},
+        "cached_at": cached_at,
+        "expires_at": cached_at + expires_in,
+    }
+
+
+class TestMemoryLayer:
+    """Test the in-process layer in front of MongoDB."""
+
+    def test_hit_before_ttl_and_miss_after(self, cache, clock):
+        """Test that a read is served from memory until the memory TTL passes."""
+        cache._collection.find_one.return_value = _doc(cache, "finnhub", "AAPL", "news")
+
+        assert cache.get("finnhub", "AAPL", "news")["data"] == {"ticker": "AAPL"}
+        clock.now += 59
+        assert cache.get("finnhub", "AAPL", "news") is not None
+        assert cache._collection.find_one.call_count == 1
+
+        clock.now += 2
+        cache._collection.find_one.return_value = None
+        assert cache.get("finnhub", "AAPL", "news") is None
+        assert cache._collection.find_one.call_count == 2
+
+    def test_deadline_capped_by_expires_at(self, cache, clock):
+        """Test that an entry leaves memory when it expires, even inside the memory TTL."""
+        cache._collection.find_one.return_value = _doc(
+            cache, "finnhub", "AAPL", "news", expires_in=timedelta(seconds=10)
+        )
+        cache.get("finnhub", "AAPL", "news")
+
+        clock.now += 11
+        cache._collection.find_one.return_value = None
+        assert cache.get("finnhub", "AAPL", "news") is None
+        assert cache._collection.find_one.call_count == 2
+
+    def test_oldest_entry_evicted_at_maxsize(self, cache, clock):
+        """Test that adding past memory_maxsize drops the oldest entry."""
+        for ticker in ("A", "B", "C", "D"):
+            cache.set("finnhub", ticker, "news", {"ticker": ticker})
+
+        keys = {cache._generate_cache_key("finnhub", ticker, "news"): ticker for ticker in "ABCD"}
+        assert [keys[key] for key in cache._memory] == ["B", "C", "D"]
+
+    def test_clear_ticker_evicts_matching_entries(self, cache, clock):
+        """Test that clear_ticker drops that ticker's entries from memory."""
+        cache.set("finnhub", "AAPL", "news", [])
+        cache.set("sec", "AAPL", "fundamentals", {})
+        cache.set("finnhub", "MSFT", "news", [])
+
+        cache.clear_ticker("AAPL")
+
+        assert [entry["ticker"] for _, entry in cache._memory.values()] == ["MSFT"]
+        cache._collection.delete_many.assert_called_once_with({"ticker": "AAPL"})
+
+    def test_clear_source_evicts_matching_entries(self, cache, clock):
+        """Test that clear_source drops that source's entries from memory."""
+        cache.set("finnhub", "AAPL", "news", [])
+        cache.set("sec", "AAPL", "fundamentals", {})
+        cache.set("finnhub", "MSFT", "news", [])
+
+        cache.clear_source("finnhub")
+
+        assert [entry["source"] for _, entry in cache._memory.values()] == ["sec"]
+        cache._collection.delete_many.assert_called_once_with({"source": "finnhub"})
+
+    @pytest.mark.parametrize("clear, args, field", [
+        ("clear_ticker", ("AAPL",), "delete_many"),
+        ("clear_source", ("finnhub",), "delete_many"),
+        ("delete", ("finnhub", "AAPL", "news"), "delete_one"),
+    ])
+    def test_read_during_delete_is_not_kept(self, cache, clock, clear, args, field):
+        """Test that a read racing the MongoDB delete does not leave the entry in memory."""
+        stored = _doc(cache, "finnhub", "AAPL", "news")
+
+        def delete_with_concurrent_read(query):
+            # Another thread reads the document before MongoDB removes it
+            cache._collection.find_one.return_value = stored
+            assert cache.get("finnhub", "AAPL", "news") is not None
+            cache._collection.find_one.return_value = None
+            return Mock(deleted_count=1)
+
+        getattr(cache._collection, field).side_effect = delete_with_concurrent_read
+        getattr(cache, clear)(*args)
+
+        assert cache._memory == {}
+        assert cache.get("finnhub", "AAPL", "news") is None
+
+
+def _find(docs):
+    """Fake collection.find honouring the $in and $gt filters get_many sends."""
+    def find(query):
+        keys = query["cache_key"]["$in"]
+        cutoff = query["expires_at"]["$gt"]
+        return [doc for doc in docs if doc["cache_key"] in keys and doc["expires_at"] > cutoff]
+    return find
+
+
+class TestBatchOperations:
+    """Test get_many and set_many."""
+
+    def test_get_many_mixes_memory_mongo_and_misses(self, cache, clock):
+        """Test that memory hits skip MongoDB and only the rest are queried in one find."""
+        cache.set("finnhub", "AAPL", "news", ["cached"])
+        stored = _doc(cache, "finnhub", "AAPL", "financials")
+        cache._collection.find.side_effect = _find([stored])
+
+        keys = [("finnhub", "AAPL", "news"), ("finnhub", "AAPL", "financials"), ("finnhub", "AAPL", "quote_data")]
+        found = cache.get_many(keys)
+
+        assert set(found) == {("finnhub", "AAPL", "news"), ("finnhub", "AAPL", "financials")}
+        assert found[("finnhub", "AAPL", "news")]["data"] == ["cached"]
+        assert found[("finnhub", "AAPL", "financials")]["data"] == {"ticker": "AAPL"}
+        cache._collection.find.assert_called_once()
+        queried = cache._collection.find.call_args.args[0]["cache_key"]["$in"]
+        assert sorted(queried) == sorted(cache._generate_cache_key(*key) for key in keys[1:])
+
+    def test_get_many_excludes_expired_entries(self, cache, clock):
+        """Test that expired documents are not returned."""
+        expired = _doc(cache, "finnhub", "AAPL", "news", expires_in=timedelta(seconds=-1))
+        fresh = _doc(cache, "finnhub", "AAPL", "financials")
+        cache._collection.find.side_effect = _find([expired, fresh])
+
+        found = cache.get_many([("finnhub", "AAPL", "news"), ("finnhub", "AAPL", "financials")])
+
+        assert list(found) == [("finnhub", "AAPL", "financials")]
+
+    def test_set_many_empty_is_a_no_op(self, cache):
+        """Test that an empty batch succeeds without touching MongoDB."""
+        assert cache.set_many([]) is True
+        cache._collection.bulk_write.assert_not_called()
+
+    def test_set_many_writes_upserts(self, cache, clock):
+        """Test the documents sent to bulk_write and that they are then served from memory."""
+        assert cache.set_many([
+            ("finnhub", "AAPL", "news", ["headline"], 6),
+            ("sec", "AAPL", "fundamentals", {"revenue": 1}, None),
+        ]) is True
+
+        operations = cache._collection.bulk_write.call_args.args[0]
+        assert cache._collection.bulk_write.call_args.kwargs == {"ordered": False}
+        written = [(op._filter, op._doc, op._upsert) for op in operations]
+        for (query, doc, upsert), (source, endpoint, data, ttl) in zip(written, [
+            ("finnhub", "news", ["headline"], 6),
+            ("sec", "fundamentals", {"revenue": 1}, cache.default_ttl_hours),
+        ]):
+            key = cache._generate_cache_key(source, "AAPL", endpoint)
+            assert query == {"cache_key": key}
+            assert upsert is True
+            assert doc["source"] == source and doc["ticker"] == "AAPL" and doc["endpoint"] == endpoint
+            assert doc["data"] == data
+            assert doc["ttl_hours"] == ttl
+            assert doc["expires_at"] - doc["cached_at"] == timedelta(hours=ttl)
+
+        assert cache.get("finnhub", "AAPL", "news")["data"] == ["headline"]
+        cache._collection.find_one.assert_not_called()
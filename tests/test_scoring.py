@@ -139,3 +139,20 @@ class TestValueScoring:
         assert get_value_score_interpretation(39) == "Poor Value"
         assert get_value_score_interpretation(20) == "Poor Value"
         assert get_value_score_interpretation(19) == "Very Poor Value"
+
+    def test_value_score_interpretation_matches_bands(self):
+        """Test the band lookup against the original threshold chain, including fractional scores."""
+        def reference(score):
+            if score >= 80:
+                return "Excellent Value"
+            elif score >= 60:
+                return "Good Value"
+            elif score >= 40:
+                return "Fair Value"
+            elif score >= 20:
+                return "Poor Value"
+            return "Very Poor Value"
+
+        scores = [-10, 0, 19.999, 20, 20.001, 39.5, 40, 59.99, 60, 79.9999, 80, 80.5, 100, 150]
+        for score in scores:
+            assert get_value_score_interpretation(score) == reference(score), score
@@ -0,0 +1,70 @@
+"""Tests for securities listing filtering and caching keys."""
+
+from datetime import datetime
+
+import pandas as pd
+
+from tabs.securities_listing_tab import _listing_version, filter_securities_data
+
+
+def _listing() -> pd.DataFrame:
+    """Build a small listing with a categorical exchange column."""
+    df = pd.DataFrame({
+        "symbol": ["AAPL", "MSFT", "BRK.B", "SPY", "ABR-P-D"],
+        "name": ["Apple Inc", "Microsoft Corp", "Berkshire Hathaway", None, "Arbor Realty (Series D)"],
+        "exchange": ["NASDAQ", "NASDAQ", "NYSE", "NYSE ARCA", "NYSE"],
+        "assetType": ["Stock", "Stock", "Stock", "ETF", "Stock"],
+        "status": ["Active"] * 5,
+    })
+    df["exchange"] = df["exchange"].astype("category")
+    return df
+
+
+class TestFilterSecuritiesData:
+    """Test filter_securities_data."""
+
+    def test_no_filters_returns_everything(self):
+        """Test that default filters keep every row."""
+        assert len(filter_securities_data(_listing())) == 5
+
+    def test_search_is_case_insensitive_over_symbol_and_name(self):
+        """Test that the search term matches symbols or names regardless of case."""
+        assert filter_securities_data(_listing(), search_term="apple")["symbol"].tolist() == ["AAPL"]
+        assert filter_securities_data(_listing(), search_term="msft")["symbol"].tolist() == ["MSFT"]
+
+    def test_search_is_literal(self):
+        """Test that regex metacharacters match literally and missing names do not fail."""
+        assert filter_securities_data(_listing(), search_term="BRK.B")["symbol"].tolist() == ["BRK.B"]
+        assert filter_securities_data(_listing(), search_term="(series")["symbol"].tolist() == ["ABR-P-D"]
+        assert filter_securities_data(_listing(), search_term=".")["symbol"].tolist() == ["BRK.B"]
+
+    def test_combined_filters(self):
+        """Test exchange, asset type and status filters together with search."""
+        df = _listing()
+        assert filter_securities_data(df, exchange_filter="NYSE")["symbol"].tolist() == ["BRK.B", "ABR-P-D"]
+        assert filter_securities_data(df, exchange_filter="NYSE", search_term="arbor")["symbol"].tolist() == ["ABR-P-D"]
+        assert filter_securities_data(df, asset_type_filter="ETF")["symbol"].tolist() == ["SPY"]
+        assert filter_securities_data(df, status_filter="Delisted").empty
+
+    def test_unknown_category_and_missing_column(self):
+        """Test that a value outside the categories, or a missing column, matches nothing."""
+        assert filter_securities_data(_listing(), exchange_filter="LSE").empty
+        assert filter_securities_data(_listing().drop(columns="status"), status_filter="Active").empty
+
+
+class TestListingVersion:
+    """Test the key for the cached listing frame and CSVs."""
+
+    def test_uses_cache_time_when_cached(self):
+        """Test that a cached listing is keyed by its count and cache time."""
+        cached_at = datetime(2026, 1, 2, 3, 4)
+        assert _listing_version([{"symbol": "A"}], 1, {"cached_at": cached_at}) == (1, cached_at)
+
+    def test_falls_back_to_content_without_cache_entry(self):
+        """Test that an uncached listing with the same count but new rows gets a new key."""
+        old = [{"symbol": "A", "status": "Active"}]
+        new = [{"symbol": "A", "status": "Delisted"}]
+
+        assert _listing_version(old, 1, None) == _listing_version(list(old), 1, None)
+        assert _listing_version(old, 1, None) != _listing_version(new, 1, None)
+
@@ -0,0 +1,28 @@
+"""Tests for dashboard ticker input handling."""
+
+import pytest
+
+from unified_dashboard import _norm_ticker
+
+
+class TestNormTicker:
+    """Test ticker normalization and validation."""
+
+    def test_strips_whitespace(self):
+        """Test that surrounding and embedded whitespace is removed."""
+        assert _norm_ticker("  AAPL \n") == "AAPL"
+        assert _norm_ticker("MS FT") == "MSFT"
+
+    def test_upper_cases(self):
+        """Test that lower-case input is upper-cased."""
+        assert _norm_ticker("aapl") == "AAPL"
+
+    @pytest.mark.parametrize("raw", ["BRK.B", "BF-B", "ABR-P-D", "brk.b"])
+    def test_accepts_suffixed_symbols(self, raw):
+        """Test that class and series suffixes offered by the listing are accepted."""
+        assert _norm_ticker(raw) == raw.upper()
+
+    @pytest.mark.parametrize("raw", ["", "   ", "AAPL!", "$AAPL", "AAPL.", "-AAPL", "TOOLONGX", "A..B", "AAPL/B"])
+    def test_rejects_invalid_symbols(self, raw):
+        """Test that invalid input normalizes to an empty string."""
+        assert _norm_ticker(raw) == ""
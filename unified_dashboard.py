@@ -2,13 +2,15 @@
 
 import streamlit as st
 import logging
+import re
 import traceback
 from volur.config import settings
 from volur.plugins.sec_source import SECSource
 from dashboard_utils import (
     get_cached_alpha_vantage_data, get_cached_finnhub_data, get_cached_sec_data,
     get_cached_finnhub_news, get_cached_finnhub_financials, get_cached_finnhub_basic_financials,
-    get_cached_alpha_vantage_listing_status, get_cache_info, clear_cache_for_ticker, get_cache_stats
+    get_cached_alpha_vantage_listing_status, get_cache_info, clear_cache_for_ticker, get_cache_stats,
+    get_cached_finnhub_bundle, prefetch_ticker
 )
 from event_system import publish_ticker_changed, EventTypes, get_event_bus
 from tabs.alpha_vantage_tab import render_alpha_vantage_tab
@@ -33,6 +35,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_TICKER_WHITESPACE = str.maketrans("", "", " \t\r\n")
+# Letters and digits, optionally with class/series suffixes (e.g. BRK.B, BF-B, ABR-P-D)
+_TICKER_RE = re.compile(r"[A-Z0-9]{1,6}(?:[.-][A-Z0-9]{1,4})*")
+
+_INTRO_MARKDOWN = """
+### Compare financial data from multiple sources:
+
+- **Alpha Vantage:** Real-time market data
+- **Finnhub:** Market data with company profiles and news
+- **SEC EDGAR:** Official financial filings
+"""
+
+
+def _norm_ticker(raw: str) -> str:
+    """Normalize a ticker for use as a cache key; returns "" if it is not a valid symbol."""
+    ticker = raw.translate(_TICKER_WHITESPACE).upper()
+    return ticker if _TICKER_RE.fullmatch(ticker) else ""
+
+
 def main():
     """Main dashboard function."""
     st.set_page_config(
@@ -48,6 +69,7 @@ def main():
     # Initialize ticker management with event-driven architecture
     if 'current_ticker' not in st.session_state:
         st.session_state.current_ticker = "AAPL"
+        prefetch_ticker(st.session_state.current_ticker)
     
     # Check if a ticker was selected from the securities listing
     if 'selected_ticker_from_listing' in st.session_state and st.session_state.selected_ticker_from_listing:
@@ -58,6 +80,7 @@ def main():
         # Update current ticker and fire event
         st.session_state.current_ticker = new_ticker
         publish_ticker_changed(new_ticker, "securities_listing")
+        prefetch_ticker(new_ticker)
         
         # Force the ticker input widget to update by using a dynamic key
         widget_key = f"ticker_input_widget_{new_ticker}_{st.session_state.get('widget_counter', 0)}"
@@ -66,19 +89,23 @@ def main():
         widget_key = "ticker_input_widget"
     
     # Ticker input - event-driven
-    ticker = st.sidebar.text_input(
+    raw_ticker = st.sidebar.text_input(
         "Stock Ticker",
         value=st.session_state.current_ticker,
         help="Enter a stock ticker symbol (e.g., AAPL, MSFT, GOOGL)",
         key=widget_key
-    ).upper().strip()
+    )
+    ticker = _norm_ticker(raw_ticker)
+    if raw_ticker.strip() and not ticker:
+        st.sidebar.error(f"'{raw_ticker.strip()}' is not a valid ticker symbol")
     
     # Check if ticker changed and fire event
-    if ticker != st.session_state.current_ticker:
+    if ticker and ticker != st.session_state.current_ticker:
         st.session_state.current_ticker = ticker
         publish_ticker_changed(ticker, "user_input")
+        prefetch_ticker(ticker)
     
-    # Create tabs for different data sources
+    # Create tabs for different data sources; only the open tab's body runs on each rerun
     tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9, tab10 = st.tabs([
         "📋 Securities Listing",
         "🔄 All Sources", 
@@ -90,7 +117,7 @@ def main():
         "📊 Finnhub Basic Financials",
         "📊 Comparison", 
         "🐛 Debug Logs"
-    ])
+    ], key="main_tabs", on_change="rerun")
     
     # Initialize session state for data if not exists
     if 'market_data' not in st.session_state:
@@ -123,12 +150,7 @@ def main():
     
     
     # Main content area
-    st.markdown("### Compare financial data from multiple sources:")
-    st.markdown("""
-    - **Alpha Vantage:** Real-time market data
-    - **Finnhub:** Market data with company profiles and news  
-    - **SEC EDGAR:** Official financial filings
-    """)
+    st.markdown(_INTRO_MARKDOWN)
     
     # Cache management section
     with st.expander("🗄️ Cache Management"):
@@ -185,57 +207,69 @@ def main():
                     st.metric("Expired Entries", stats.get("expired_entries", 0))
                 
                 if stats.get("source_counts"):
-                    st.markdown("**Entries by Source:**")
-                    for source, count in stats["source_counts"].items():
-                        st.write(f"- {source.title()}: {count}")
+                    st.markdown("**Entries by Source:**\n\n" + "\n".join(
+                        f"- {source.title()}: {count}" for source, count in stats["source_counts"].items()
+                    ))
         
         st.divider()
         
         # Fetch Data button - let individual tabs handle their own data fetching
         if st.sidebar.button("Fetch Data", type="primary", key="fetch_data_main") and ticker:
+            # Warm every Finnhub tab's cache in one batched round-trip before the tabs render
+            get_cached_finnhub_bundle(ticker)
             st.success(f"Fetching data for {ticker}... Each tab will load its own data.")
             st.rerun()
         
-        # Render all tabs - event-driven architecture
+        # Render the open tab - event-driven architecture
         with tab1:
             # Generic dataset tab - independent of ticker
-            render_securities_listing_tab(st.session_state.securities_listing)
+            if tab1.open:
+                render_securities_listing_tab(st.session_state.securities_listing)
         
         with tab2:
             # Ticker-driven tab - subscribes to ticker events
-            render_all_sources_tab(st.session_state.current_ticker)
+            if tab2.open:
+                render_all_sources_tab(st.session_state.current_ticker)
         
         with tab3:
             # Ticker-driven tab - subscribes to ticker events
-            render_alpha_vantage_tab(st.session_state.current_ticker)
+            if tab3.open:
+                render_alpha_vantage_tab(st.session_state.current_ticker)
         
         with tab4:
             # Ticker-driven tab - subscribes to ticker events
-            render_sec_edgar_tab(st.session_state.current_ticker)
+            if tab4.open:
+                render_sec_edgar_tab(st.session_state.current_ticker)
         
         with tab5:
             # Ticker-driven tab - subscribes to ticker events
-            render_finnhub_tab(st.session_state.current_ticker)
+            if tab5.open:
+                render_finnhub_tab(st.session_state.current_ticker)
         
         with tab6:
             # Ticker-driven tab - subscribes to ticker events
-            render_finnhub_news_tab(st.session_state.current_ticker)
+            if tab6.open:
+                render_finnhub_news_tab(st.session_state.current_ticker)
         
         with tab7:
             # Ticker-driven tab - subscribes to ticker events
-            render_finnhub_financials_tab(st.session_state.current_ticker)
+            if tab7.open:
+                render_finnhub_financials_tab(st.session_state.current_ticker)
         
         with tab8:
             # Ticker-driven tab - subscribes to ticker events
-            render_finnhub_basic_financials_tab(st.session_state.current_ticker)
+            if tab8.open:
+                render_finnhub_basic_financials_tab(st.session_state.current_ticker)
         
         with tab9:
             # Ticker-driven tab - subscribes to ticker events
-            render_comparison_tab(st.session_state.current_ticker)
+            if tab9.open:
+                render_comparison_tab(st.session_state.current_ticker)
         
         with tab10:
             # Generic tab - independent of ticker
-            render_debug_logs_tab()
+            if tab10.open:
+                render_debug_logs_tab()
 
 if __name__ == "__main__":
     main()
@@ -3,7 +3,7 @@
 import functools
 import hashlib
 import os
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, TypeVar, cast
 
 import diskcache as dc
 
@@ -48,12 +48,14 @@ class Cache:
 # Global cache instance
 cache = Cache()
 
+F = TypeVar("F", bound=Callable[..., Any])
 
-def cached(ttl: Optional[int] = None):
+
+def cached(ttl: Optional[int] = None) -> Callable[[F], F]:
     """Decorator for caching function results."""
-    def decorator(func: Callable) -> Callable:
+    def decorator(func: F) -> F:
         @functools.wraps(func)
-        def wrapper(*args, **kwargs):
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
             # Create cache key from function name and arguments
             key_parts = [func.__name__]
             key_parts.extend(str(arg) for arg in args)
@@ -70,5 +72,5 @@ def cached(ttl: Optional[int] = None):
             cache.set(key, result, ttl)
             return result
 
-        return wrapper
+        return cast(F, wrapper)
     return decorator
@@ -2,6 +2,7 @@
 
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
 from .config import settings
@@ -44,6 +45,7 @@ def print_valuation_table(results: List, source_name: str) -> None:
     # Table rows
     for result in results:
         print(f"{result.ticker:<8} "
+              f"{format_currency(result.current_price):<10} "
               f"{format_currency(result.intrinsic_value_per_share):<12} "
               f"{format_percentage(result.margin_of_safety):<8} "
               f"{format_number(result.value_score):<8} "
@@ -147,13 +149,18 @@ Examples:
 
     print(f"Analyzing {len(args.ticker)} ticker(s) using {args.source} data source...")
 
-    for ticker in args.ticker:
-        try:
-            result = analyze_stock(data_source, ticker.upper(), dcf_params)
-            results.append(result)
-        except Exception as e:
-            print(f"Error analyzing {ticker}: {e}", file=sys.stderr)
-            errors.append(ticker)
+    # Tickers are independent and network-bound, so analyze them concurrently
+    with ThreadPoolExecutor(max_workers=min(8, len(args.ticker))) as executor:
+        futures = [
+            (ticker, executor.submit(analyze_stock, data_source, ticker.upper(), dcf_params))
+            for ticker in args.ticker
+        ]
+        for ticker, future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                print(f"Error analyzing {ticker}: {e}", file=sys.stderr)
+                errors.append(ticker)
 
     # Print results
     if results:
@@ -8,6 +8,7 @@ from typing import Optional
 class ValuationResult:
     """Result of a valuation calculation."""
     ticker: str
+    current_price: Optional[float] = None
     intrinsic_value_per_share: Optional[float] = None
     intrinsic_value_total: Optional[float] = None
     margin_of_safety: Optional[float] = None
@@ -19,7 +20,7 @@ class ValuationResult:
     debt_to_equity: Optional[float] = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class DCFParams:
     """Parameters for DCF calculation."""
     discount_rate: float = 0.10
@@ -1,5 +1,6 @@
 """Finnhub data source implementation."""
 
+import orjson
 import requests
 from typing import Optional
 from volur.plugins.base import DataSource, Quote, Fundamentals
@@ -22,7 +23,15 @@ class FinnhubSource:
             "X-Finnhub-Token": self.api_key,
             "User-Agent": "Volur/0.1.0"
         }
+        # Reuse keep-alive connections across calls; the token is sent as a default header
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+
+    def __repr__(self) -> str:
+        """Stable across processes, since the cached decorator keys on str(self)."""
+        return f"{type(self).__name__}({self.name!r})"
     
+    @cached(ttl=300)  # Cache for 5 minutes
     def get_quote(self, ticker: str) -> Optional[Quote]:
         """Get current quote from Finnhub."""
         try:
@@ -30,9 +39,9 @@ class FinnhubSource:
             quote_url = f"{self.base_url}/quote"
             params = {"symbol": ticker}
             
-            response = requests.get(quote_url, params=params, headers=self.headers, timeout=10)
+            response = self.session.get(quote_url, params=params, timeout=10)
             response.raise_for_status()
-            quote_data = response.json()
+            quote_data = orjson.loads(response.content)
             
             # Debug logging
             print(f"Finnhub quote response for {ticker}: {quote_data}")
@@ -46,8 +55,8 @@ class FinnhubSource:
             profile_url = f"{self.base_url}/stock/profile2"
             profile_params = {"symbol": ticker}
             
-            profile_response = requests.get(profile_url, params=profile_params, headers=self.headers, timeout=10)
-            profile_data = profile_response.json() if profile_response.status_code == 200 else {}
+            profile_response = self.session.get(profile_url, params=profile_params, timeout=10)
+            profile_data = orjson.loads(profile_response.content) if profile_response.status_code == 200 else {}
             
             print(f"Finnhub profile response for {ticker}: {profile_data}")
             
@@ -62,6 +71,7 @@ class FinnhubSource:
             print(f"Finnhub API error for {ticker}: {e}")
             return None
     
+    @cached(ttl=3600)  # Cache for 1 hour
     def get_fundamentals(self, ticker: str) -> Optional[Fundamentals]:
         """Get fundamental data from Finnhub."""
         try:
@@ -69,22 +79,22 @@ class FinnhubSource:
             profile_url = f"{self.base_url}/stock/profile2"
             profile_params = {"symbol": ticker}
             
-            profile_response = requests.get(profile_url, params=profile_params, headers=self.headers, timeout=10)
-            profile_data = profile_response.json() if profile_response.status_code == 200 else {}
+            profile_response = self.session.get(profile_url, params=profile_params, timeout=10)
+            profile_data = orjson.loads(profile_response.content) if profile_response.status_code == 200 else {}
             
             # Get financial metrics
             metrics_url = f"{self.base_url}/stock/metric"
             metrics_params = {"symbol": ticker, "metric": "all"}
             
-            metrics_response = requests.get(metrics_url, params=metrics_params, headers=self.headers, timeout=10)
-            metrics_data = metrics_response.json() if metrics_response.status_code == 200 else {}
+            metrics_response = self.session.get(metrics_url, params=metrics_params, timeout=10)
+            metrics_data = orjson.loads(metrics_response.content) if metrics_response.status_code == 200 else {}
             
             # Get financial statements (basic)
             financials_url = f"{self.base_url}/stock/financials-reported"
             financials_params = {"symbol": ticker, "freq": "annual"}
             
-            financials_response = requests.get(financials_url, params=financials_params, headers=self.headers, timeout=10)
-            financials_data = financials_response.json() if financials_response.status_code == 200 else {}
+            financials_response = self.session.get(financials_url, params=financials_params, timeout=10)
+            financials_data = orjson.loads(financials_response.content) if financials_response.status_code == 200 else {}
             
             # Extract financial data
             current_metrics = metrics_data.get('metric', {})
@@ -113,5 +123,5 @@ class FinnhubSource:
 
 
 # Register the source
-from volur.plugins import register_source
+from volur.plugins.base import register_source
 register_source(FinnhubSource())
@@ -2,6 +2,7 @@
 
 import os
 
+import orjson
 import requests
 
 from ..caching import cached
@@ -20,6 +21,12 @@ class FMPSource:
         self.api_key = settings.fmp_api_key or os.getenv('FMP_API_KEY')
         if not self.api_key:
             raise ValueError("FMP_API_KEY environment variable is required for FMP data source")
+        # Reuse keep-alive connections across calls
+        self.session = requests.Session()
+
+    def __repr__(self) -> str:
+        """Stable across processes, since the cached decorator keys on str(self)."""
+        return f"{type(self).__name__}({self.name!r})"
 
     @cached(ttl=3600)  # Cache for 1 hour
     def get_quote(self, ticker: str) -> Quote:
@@ -27,10 +34,10 @@ class FMPSource:
         try:
             url = f"{self.base_url}/quote/{ticker}"
             params = {'apikey': self.api_key}
-            response = requests.get(url, params=params, timeout=30)
+            response = self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
             if not data:
                 return Quote(ticker=ticker.upper(), price=None)
 
@@ -53,20 +60,20 @@ class FMPSource:
             # Get key metrics
             url = f"{self.base_url}/key-metrics/{ticker}"
             params = {'apikey': self.api_key, 'limit': 1}
-            response = requests.get(url, params=params, timeout=30)
+            response = self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
 
-            metrics_data = response.json()
+            metrics_data = orjson.loads(response.content)
 
             # Get financial ratios
             ratios_url = f"{self.base_url}/ratios/{ticker}"
-            ratios_response = requests.get(ratios_url, params=params, timeout=30)
-            ratios_data = ratios_response.json() if ratios_response.status_code == 200 else []
+            ratios_response = self.session.get(ratios_url, params=params, timeout=30)
+            ratios_data = orjson.loads(ratios_response.content) if ratios_response.status_code == 200 else []
 
             # Get company profile
             profile_url = f"{self.base_url}/profile/{ticker}"
-            profile_response = requests.get(profile_url, params={'apikey': self.api_key}, timeout=30)
-            profile_data = profile_response.json() if profile_response.status_code == 200 else []
+            profile_response = self.session.get(profile_url, params={'apikey': self.api_key}, timeout=30)
+            profile_data = orjson.loads(profile_response.content) if profile_response.status_code == 200 else []
 
             # Extract data
             metrics = metrics_data[0] if metrics_data else {}
@@ -2,6 +2,7 @@
 
 from typing import Any, Dict, Optional
 
+import orjson
 import requests
 
 from ..caching import cached
@@ -14,6 +15,21 @@ class SECSource:
 
     name = "sec"
     base_url = "https://data.sec.gov/api/xbrl/companyfacts"
+    tickers_url = "https://www.sec.gov/files/company_tickers.json"
+    # Fallback CIKs for well-known tickers when the tickers file can't be fetched
+    known_ciks = {
+        'AAPL': '0000320193',
+        'MSFT': '0000789019',
+        'GOOGL': '0001652044',
+        'AMZN': '0001018724',
+        'TSLA': '0001318605',
+        'META': '0001326801',
+        'NVDA': '0001045810',
+        'BRK.A': '0001067983',
+        'BRK.B': '0001067983',
+        'JNJ': '0000200406',
+        'JPM': '0000019617'
+    }
 
     def __init__(self):
         """Initialize SEC source with proper headers."""
@@ -21,6 +37,13 @@ class SECSource:
             'User-Agent': settings.sec_user_agent,
             'Accept': 'application/json'
         }
+        # Reuse keep-alive connections to data.sec.gov across lookups
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+
+    def __repr__(self) -> str:
+        """Stable across processes, since the cached decorator keys on str(self)."""
+        return f"{type(self).__name__}({self.name!r})"
 
     @cached(ttl=86400)  # Cache for 24 hours
     def get_quote(self, ticker: str) -> Quote:
@@ -40,10 +63,10 @@ class SECSource:
 
             # Fetch company facts
             url = f"{self.base_url}/CIK{cik.zfill(10)}.json"
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = self.session.get(url, timeout=30)
             response.raise_for_status()
 
-            data = response.json()
+            data = orjson.loads(response.content)
             facts = data.get('facts', {})
 
             # Extract relevant metrics
@@ -83,17 +106,17 @@ class SECSource:
 
     def _get_cik_from_ticker(self, ticker: str) -> Optional[str]:
         """Convert ticker symbol to CIK."""
+        ticker = ticker.upper()
         try:
             # Use SEC's company tickers API to get CIK
-            tickers_url = "https://www.sec.gov/files/company_tickers.json"
-            response = requests.get(tickers_url, headers=self.headers, timeout=30)
+            response = self.session.get(self.tickers_url, timeout=30)
             response.raise_for_status()
             
-            tickers_data = response.json()
+            tickers_data = orjson.loads(response.content)
             
             # Find the CIK for the given ticker
             for entry in tickers_data.values():
-                if entry.get('ticker', '').upper() == ticker.upper():
+                if entry.get('ticker', '').upper() == ticker:
                     cik = str(entry.get('cik_str', ''))
                     return cik.zfill(10)  # SEC expects 10-digit CIK
             
@@ -101,20 +124,7 @@ class SECSource:
             
         except Exception:
             # Fallback: try some well-known ticker mappings
-            known_mappings = {
-                'AAPL': '0000320193',
-                'MSFT': '0000789019', 
-                'GOOGL': '0001652044',
-                'AMZN': '0001018724',
-                'TSLA': '0001318605',
-                'META': '0001326801',
-                'NVDA': '0001045810',
-                'BRK.A': '0001067983',
-                'BRK.B': '0001067983',
-                'JNJ': '0000200406',
-                'JPM': '0000019617'
-            }
-            return known_mappings.get(ticker.upper())
+            return self.known_ciks.get(ticker)
 
     def _get_latest_value(self, metric_data: Dict[str, Any]) -> Optional[float]:
         """Extract the latest value from SEC metric data."""
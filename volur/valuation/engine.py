@@ -40,6 +40,7 @@ def calculate_comprehensive_valuation(
 
     return ValuationResult(
         ticker=quote.ticker,
+        current_price=quote.price,
         intrinsic_value_per_share=intrinsic_value_per_share,
         intrinsic_value_total=intrinsic_value_total,
         margin_of_safety=margin_of_safety,
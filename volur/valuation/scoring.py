@@ -1,5 +1,6 @@
 """Value scoring calculations."""
 
+from bisect import bisect_right
 from typing import Optional
 
 from ..config import settings
@@ -79,6 +80,11 @@ def _calculate_fcf_yield_for_scoring(quote: Quote, fundamentals: Fundamentals) -
     return fundamentals.free_cash_flow / market_cap
 
 
+# Lower bounds of each interpretation band, ascending, with one more label than bound
+_SCORE_BANDS = (20, 40, 60, 80)
+_SCORE_LABELS = ("Very Poor Value", "Poor Value", "Fair Value", "Good Value", "Excellent Value")
+
+
 def get_value_score_interpretation(score: float) -> str:
     """Get interpretation of value score.
     
@@ -88,13 +94,4 @@ def get_value_score_interpretation(score: float) -> str:
     Returns:
         Interpretation string
     """
-    if score >= 80:
-        return "Excellent Value"
-    elif score >= 60:
-        return "Good Value"
-    elif score >= 40:
-        return "Fair Value"
-    elif score >= 20:
-        return "Poor Value"
-    else:
-        return "Very Poor Value"
+    return _SCORE_LABELS[bisect_right(_SCORE_BANDS, score)]